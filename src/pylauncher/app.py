@@ -2,11 +2,27 @@
 
 from __future__ import annotations
 
+import os
+import queue
+import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from tkinter import filedialog, messagebox
 
 import customtkinter as ctk
 
+# tkinter.filedialog / tkinter.messagebox are imported inside the methods
+# that open them — they are only hit on user action and cost import time
+# on cold start.
+
+if sys.platform == "win32":
+    import ctypes
+
+    _user32 = ctypes.windll.user32
+else:
+    _user32 = None
+
 from pylauncher.constants import (
     BG_DARK,
     MAIN_WINDOW_WIDTH,
@@ -28,6 +44,8 @@ from pylauncher.ui.main_window import MainWindow
 class PyLauncherApp(ctk.CTk):
     """Root application window and controller."""
 
+    OUTPUT_DRAIN_MS = 50  # batch interval for subprocess output / log lines
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -43,13 +61,24 @@ class PyLauncherApp(ctk.CTk):
         self._setup_taskbar_icon()
 
         # Core initialization
+        scripts_dir = get_scripts_dir()
         self._settings_manager = SettingsManager(get_settings_path())
         self._settings = self._settings_manager.load()
-        self._script_manager = ScriptManager(get_scripts_dir())
+        self._script_manager = ScriptManager(scripts_dir)
+        # Shared pool for IO-bound background work (pip installs, pipreqs),
+        # bounding concurrency instead of spawning a thread per call.
+        self._io_pool = ThreadPoolExecutor(max_workers=10, thread_name_prefix="pylauncher-io")
         self._process_handler = ProcessHandler(self._settings.python_path)
-        self._venv_manager = VenvManager(self._settings.python_path)
+        self._venv_manager = VenvManager(self._settings.python_path, pool=self._io_pool)
         self._state_manager = StateManager(get_state_path())
 
+        # Folder-key → ScriptInfo map shared by scheduler/restore paths,
+        # rebuilt lazily after the scripts directory changes.
+        self._script_map_cache: dict[str, ScriptInfo] | None = None
+        # Fingerprint of the scripts dir from the last refresh, used to
+        # skip UI rebuilds when watcher events carry no visible change.
+        self._discover_signature: frozenset[tuple[str, int, bool, int]] | None = None
+
         # UI
         self._title_bar = TitleBar(
             self,
@@ -62,33 +91,41 @@ class PyLauncherApp(ctk.CTk):
         self._main_window = MainWindow(self, self)
         self._main_window.pack(fill="both", expand=True)
 
-        # Load scripts
-        self._main_window.installed_tab.refresh_scripts()
-        self._main_window.logs_tab.log("PyLauncher started.")
-
-        # Scheduler
+        # Subprocess output and background log lines are queued here and
+        # drained in batches on a timer — one Tk event per tick instead of
+        # one per line, which keeps chatty scripts from saturating the
+        # event loop.
+        self._output_queues: dict[str, deque[str]] = {}
+        self._log_queue: deque[str] = deque()
+        self._output_lock = threading.Lock()
+        # Cross-thread UI callbacks ride the same tick through one
+        # SimpleQueue instead of a Tcl timer handler per after(0) call.
+        self._ui_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.after(self.OUTPUT_DRAIN_MS, self._drain_outputs)
+
+        # Queued rather than logged directly: touching logs_tab here
+        # would build its lazy body before the first paint.
+        self._queue_log("PyLauncher started.")
+
+        # Scheduler (started once scripts are discovered)
         self._scheduler = Scheduler(
-            on_trigger=lambda key: self.after(0, lambda: self._on_scheduled_trigger(key)),
+            on_trigger=self._queue_trigger,
             is_running=self._process_handler.is_running,
-            on_log=lambda msg: self.after(0, lambda: self._main_window.logs_tab.log(msg)),
+            on_log=self._queue_log,
         )
-        self._load_schedules()
-        self._scheduler.start()
 
-        # File watcher for auto-discovery
+        # File watcher for auto-discovery (started after bootstrap)
         self._script_watcher = ScriptWatcher(
-            get_scripts_dir(),
-            on_change=lambda: self.after(0, self._main_window.installed_tab.refresh_scripts),
+            scripts_dir,
+            on_change=self._queue_scripts_changed,
         )
-        self._script_watcher.start()
 
-        # System tray
+        # System tray (started after bootstrap)
         self._tray = TrayManager(
-            on_show=lambda: self.after(0, self._show_window),
-            on_exit=lambda: self.after(0, self._on_exit),
+            on_show=self._on_tray_show,
+            on_exit=self._on_tray_exit,
             get_running_names=self._process_handler.get_running_names,
         )
-        self._tray.start()
 
         # Keyboard shortcuts
         self.bind_all("<Control-i>", lambda e: self.import_script())
@@ -96,15 +133,16 @@ class PyLauncherApp(ctk.CTk):
         self.bind_all("<Control-l>", lambda e: self._main_window.set_tab("Logs"))
         self.bind_all("<F5>", lambda e: self._main_window.installed_tab.refresh_scripts())
 
-        # Restore previous session
-        self._restore_previous_session()
-
         # Drag-and-drop (optional)
         self._setup_dnd()
 
         # Shutdown hook
         self.protocol("WM_DELETE_WINDOW", self._on_close)
 
+        # Defer the filesystem walk so the window paints immediately;
+        # results are marshalled back through the UI queue.
+        threading.Thread(target=self._bootstrap, daemon=True).start()
+
     # ── Properties ──
 
     @property
@@ -118,6 +156,8 @@ class PyLauncherApp(ctk.CTk):
     # ── Controller methods ──
 
     def start_script(self, script_info: ScriptInfo) -> None:
+        from tkinter import messagebox
+
         folder_key = script_info.folder_path.name
         if self._process_handler.is_running(folder_key):
             return
@@ -127,18 +167,12 @@ class PyLauncherApp(ctk.CTk):
 
         self._main_window.logs_tab.log(f"Starting: {script_info.meta.script_name}")
 
-        def on_output(key: str, line: str) -> None:
-            self.after(0, lambda: self._main_window.running_tab.append_output(key, line))
-
-        def on_exit(key: str, rc: int) -> None:
-            self.after(0, lambda: self._on_script_exit(key, rc))
-
         self._process_handler.start_script(
             folder_path=script_info.folder_path,
             main_script=script_info.meta.main_script,
             script_name=script_info.meta.script_name,
-            on_output=on_output,
-            on_exit=on_exit,
+            on_output=self._queue_output,
+            on_exit=self._queue_exit,
         )
 
         self._main_window.running_tab.add_process_tab(folder_key, script_info.meta.script_name)
@@ -159,24 +193,28 @@ class PyLauncherApp(ctk.CTk):
         folder_path = script_info.folder_path
         self._main_window.logs_tab.log(f"Installing requirements for: {script_info.meta.script_name}")
 
-        def on_output(line: str) -> None:
-            self.after(0, lambda: self._main_window.logs_tab.log(line))
-
         def on_complete(success: bool) -> None:
-            if success:
-                self.after(0, lambda: messagebox.showinfo("Success", "Requirements installed successfully!"))
-            self.after(0, lambda: self._main_window.installed_tab.refresh_scripts())
+            self._post(self._on_install_complete, folder_path, success)
 
-        self._venv_manager.install_requirements(folder_path, on_output, on_complete)
+        self._venv_manager.install_requirements(folder_path, self._queue_log, on_complete)
+
+    def _on_install_complete(self, folder_path: Path, success: bool) -> None:
+        from tkinter import messagebox
+
+        self._process_handler.invalidate_venv(folder_path)
+        if success:
+            messagebox.showinfo("Success", "Requirements installed successfully!")
+        self._main_window.installed_tab.refresh_scripts()
 
     def import_script(self) -> None:
+        from tkinter import filedialog, messagebox
+
         folder = filedialog.askdirectory(title="Select script folder")
         if not folder:
             return
 
         source = Path(folder)
-        py_files = list(source.glob("*.py"))
-        if not py_files:
+        if not self._script_manager.has_py_files(source):
             messagebox.showwarning("Warning", "No Python (.py) files found in the folder.")
             return
 
@@ -193,11 +231,9 @@ class PyLauncherApp(ctk.CTk):
 
         self._main_window.logs_tab.log(f"Importing: {script_name}")
 
-        def on_progress(msg: str) -> None:
-            self.after(0, lambda: self._main_window.logs_tab.log(msg))
-
         try:
-            info = self._script_manager.import_script(source, script_name, on_progress)
+            info = self._script_manager.import_script(source, script_name, self._queue_log)
+            self._invalidate_script_map()
             self._main_window.installed_tab.refresh_scripts()
             self._main_window.logs_tab.log(f"Import complete: {script_name}")
 
@@ -211,13 +247,16 @@ class PyLauncherApp(ctk.CTk):
                     self._script_manager.auto_generate_requirements(
                         info.folder_path,
                         self._settings.python_path,
-                        on_output=lambda msg: self.after(0, lambda: self._main_window.logs_tab.log(msg)),
-                        on_complete=lambda ok: self.after(0, lambda: self._main_window.installed_tab.refresh_scripts()),
+                        on_output=self._queue_log,
+                        on_complete=lambda ok: self._post(self._main_window.installed_tab.refresh_scripts),
+                        pool=self._io_pool,
                     )
         except Exception as e:
             messagebox.showerror("Error", f"Import failed: {e}")
 
     def delete_script(self, script_info: ScriptInfo) -> None:
+        from tkinter import messagebox
+
         result = messagebox.askyesno(
             "Confirm Delete",
             f"Are you sure you want to delete '{script_info.meta.script_name}'?",
@@ -231,6 +270,8 @@ class PyLauncherApp(ctk.CTk):
 
         self._scheduler.remove_schedule(folder_key)
         self._script_manager.delete_script(script_info)
+        self._process_handler.invalidate_venv(script_info.folder_path)
+        self._invalidate_script_map()
         self._main_window.installed_tab.refresh_scripts()
         self._main_window.logs_tab.log(f"Deleted: {script_info.meta.script_name}")
 
@@ -247,9 +288,12 @@ class PyLauncherApp(ctk.CTk):
 
         def on_save(new_schedule: str) -> None:
             script_info.meta.schedule = new_schedule
+            # Drop the stale cached_property value for the new schedule
+            script_info.meta.__dict__.pop("schedule_display", None)
             ScriptMetaManager.save(script_info.folder_path, script_info.meta)
             folder_key = script_info.folder_path.name
             self._scheduler.update_schedule(folder_key, new_schedule)
+            self._invalidate_script_map()
             self._main_window.installed_tab.refresh_scripts()
             self._main_window.logs_tab.log(
                 f"Schedule updated for '{script_info.meta.script_name}': {new_schedule}"
@@ -264,25 +308,82 @@ class PyLauncherApp(ctk.CTk):
 
     # ── Private methods ──
 
-    def _load_schedules(self) -> None:
-        """Load all script schedules into the scheduler."""
+    def _get_script_map(self) -> dict[str, ScriptInfo]:
+        """Return the cached folder-key → ScriptInfo map, rebuilding on miss."""
+        if self._script_map_cache is None:
+            self._script_map_cache = {
+                s.folder_path.name: s for s in self._script_manager.discover_all()
+            }
+        return self._script_map_cache
+
+    def _invalidate_script_map(self) -> None:
+        self._script_map_cache = None
+
+    def _compute_discover_signature(self) -> frozenset[tuple[str, int, bool, int]]:
+        """Cheap fingerprint of the scripts dir: two stats per script folder.
+
+        Captures what a refresh could change — folder set, me.ini mtime,
+        requirements.txt presence, and the folder's own mtime (which
+        moves on file add/remove, so a newly dropped .py re-runs
+        main-script auto-detection, while content edits inside existing
+        files still don't force a rebuild).
+        """
+        sig: set[tuple[str, int, bool, int]] = set()
+        try:
+            with os.scandir(self._script_manager.scripts_dir) as it:
+                for entry in it:
+                    if not entry.is_dir():
+                        continue
+                    try:
+                        mtime = os.stat(os.path.join(entry.path, "me.ini")).st_mtime_ns
+                        dir_mtime = entry.stat().st_mtime_ns
+                    except OSError:
+                        continue
+                    has_req = os.path.exists(os.path.join(entry.path, "requirements.txt"))
+                    sig.add((entry.name, mtime, has_req, dir_mtime))
+        except OSError:
+            pass
+        return frozenset(sig)
+
+    def _on_scripts_changed(self, changed: set[str]) -> None:
+        """Handle a batched change notification from the file watcher."""
+        signature = self._compute_discover_signature()
+        if signature == self._discover_signature:
+            return
+        self._discover_signature = signature
+        self._invalidate_script_map()
+        self._main_window.installed_tab.refresh_scripts()
+
+    def _bootstrap(self) -> None:
+        """Background startup: walk scripts/ off the Tk main thread."""
+        self._discover_signature = self._compute_discover_signature()
         scripts = self._script_manager.discover_all()
-        schedule_map = {
-            s.folder_path.name: s.meta.schedule
-            for s in scripts
-            if s.meta.has_schedule
-        }
+        script_map = {s.folder_path.name: s for s in scripts}
+        schedule_map = dict(self._script_manager.iter_scheduled())
+        self._post(self._apply_bootstrap, script_map, schedule_map)
+
+    def _apply_bootstrap(
+        self,
+        script_map: dict[str, ScriptInfo],
+        schedule_map: dict[str, str],
+    ) -> None:
+        """Apply background discovery results and start the services."""
+        self._script_map_cache = script_map
+        self._main_window.installed_tab.refresh_scripts(scripts=list(script_map.values()))
         self._scheduler.load_all(schedule_map)
+        self._scheduler.start()
+        self._script_watcher.start()
+        self._tray.start()
+        self._restore_previous_session()
 
     def _on_scheduled_trigger(self, folder_key: str) -> None:
-        """Handle a scheduler trigger — find the script and start it."""
-        scripts = self._script_manager.discover_all()
-        script_map = {s.folder_path.name: s for s in scripts}
-        if folder_key in script_map:
+        """Handle a scheduler trigger — resolve the script and start it."""
+        script_info = self._get_script_map().get(folder_key)
+        if script_info is not None:
             self._main_window.logs_tab.log(
-                f"[Scheduler] Starting '{script_map[folder_key].meta.script_name}'"
+                f"[Scheduler] Starting '{script_info.meta.script_name}'"
             )
-            self.start_script(script_map[folder_key])
+            self.start_script(script_info)
         else:
             self._main_window.logs_tab.log(
                 f"[Scheduler] Script '{folder_key}' not found, skipping."
@@ -294,7 +395,91 @@ class PyLauncherApp(ctk.CTk):
         self._venv_manager.update_python_path(settings.python_path)
         self._main_window.logs_tab.log("Settings updated.")
 
+    # ── Background-thread callbacks ──
+    # Bound methods, not per-call closures: reader threads invoke these for
+    # every output line, and after() forwards extra args itself.
+
+    def _queue_output(self, folder_key: str, lines: list[str]) -> None:
+        """Reader-thread output callback — enqueue a batch for the drain tick."""
+        with self._output_lock:
+            self._output_queues.setdefault(folder_key, deque()).extend(lines)
+
+    def _post(self, callback, *args) -> None:
+        """Thread-safe: run a callable on the Tk thread at the next drain tick."""
+        self._ui_queue.put_nowait((callback, args))
+
+    def _queue_exit(self, folder_key: str, return_code: int) -> None:
+        """Reader-thread exit callback — marshal to the Tk main thread."""
+        self._post(self._on_script_exit, folder_key, return_code)
+
+    def _queue_trigger(self, folder_key: str) -> None:
+        """Scheduler-thread trigger callback — marshal to the Tk main thread."""
+        self._post(self._on_scheduled_trigger, folder_key)
+
+    def _queue_scripts_changed(self, changed: set[str]) -> None:
+        """Watcher-thread change callback — marshal to the Tk main thread."""
+        self._post(self._on_scripts_changed, changed)
+
+    def _on_tray_show(self) -> None:
+        self._post(self._show_window)
+
+    def _on_tray_exit(self) -> None:
+        self._post(self._on_exit)
+
+    def _queue_log(self, message: str) -> None:
+        """Queue a log line from a background thread for the next drain tick."""
+        with self._output_lock:
+            self._log_queue.append(message)
+
+    def _drain_outputs(self) -> None:
+        """Flush queued subprocess output and log lines to the UI in batches.
+
+        This single tick carries all cross-thread traffic, so one
+        raising callback must never kill it: each unit of work is
+        isolated and the reschedule happens in a finally.
+        """
+        try:
+            with self._output_lock:
+                batches = self._output_queues
+                logs = self._log_queue
+                self._output_queues = {}
+                self._log_queue = deque()
+            for key, lines in batches.items():
+                if lines:
+                    try:
+                        self._main_window.running_tab.append_output_batch(key, lines)
+                    except Exception:
+                        self.report_callback_exception(*sys.exc_info())
+            for msg in logs:
+                try:
+                    self._main_window.logs_tab.log(msg)
+                except Exception:
+                    self.report_callback_exception(*sys.exc_info())
+            for _ in range(256):
+                try:
+                    callback, args = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    callback(*args)
+                except Exception:
+                    # Report like Tk would for a failing after() callback
+                    self.report_callback_exception(*sys.exc_info())
+        finally:
+            try:
+                self.after(self.OUTPUT_DRAIN_MS, self._drain_outputs)
+            except Exception:
+                pass  # A drained callback (e.g. tray Exit) destroyed the window
+
+    def _flush_output(self, folder_key: str) -> None:
+        """Drain one script's pending output immediately (e.g. before exit marker)."""
+        with self._output_lock:
+            lines = self._output_queues.pop(folder_key, None)
+        if lines:
+            self._main_window.running_tab.append_output_batch(folder_key, lines)
+
     def _on_script_exit(self, folder_key: str, return_code: int) -> None:
+        self._flush_output(folder_key)
         self._main_window.logs_tab.log(f"Script '{folder_key}' exited with code {return_code}")
         self._main_window.running_tab.mark_exited(folder_key, return_code)
         self._main_window.installed_tab.update_script_state(folder_key, running=False)
@@ -318,6 +503,7 @@ class PyLauncherApp(ctk.CTk):
         self._script_watcher.stop()
         self._tray.stop()
         self._process_handler.shutdown()
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
         self.destroy()
 
     def _show_window(self) -> None:
@@ -326,6 +512,8 @@ class PyLauncherApp(ctk.CTk):
         self.focus_force()
 
     def _restore_previous_session(self) -> None:
+        from tkinter import messagebox
+
         state = self._state_manager.load()
         if not state.running_scripts:
             return
@@ -336,8 +524,7 @@ class PyLauncherApp(ctk.CTk):
             f"Previously running scripts:\n{names}\n\nRestart them?",
         )
         if result:
-            scripts = self._script_manager.discover_all()
-            script_map = {s.folder_path.name: s for s in scripts}
+            script_map = self._get_script_map()
             for key in state.running_scripts:
                 if key in script_map:
                     self.start_script(script_map[key])
@@ -355,11 +542,19 @@ class PyLauncherApp(ctk.CTk):
 
     def _on_dnd_drop(self, files: list) -> None:
         """Handle dropped files/folders."""
+        from tkinter import messagebox
+
+        scripts_dir = self._script_manager.scripts_dir
         for file_bytes in files:
-            path_str = file_bytes.decode("utf-8") if isinstance(file_bytes, bytes) else str(file_bytes)
+            # errors="replace": one undecodable path must not abort the batch
+            path_str = (
+                file_bytes.decode("utf-8", errors="replace")
+                if isinstance(file_bytes, bytes)
+                else str(file_bytes)
+            )
             source = Path(path_str)
-            if source.is_dir() and list(source.glob("*.py")):
-                dest = self._script_manager.scripts_dir / source.name
+            if source.is_dir() and self._script_manager.has_py_files(source):
+                dest = scripts_dir / source.name
                 if dest.exists():
                     self._main_window.logs_tab.log(f"Skipped: '{source.name}' already exists.")
                     continue
@@ -372,6 +567,7 @@ class PyLauncherApp(ctk.CTk):
                 if script_name:
                     try:
                         self._script_manager.import_script(source, script_name)
+                        self._invalidate_script_map()
                         self._main_window.installed_tab.refresh_scripts()
                         self._main_window.logs_tab.log(f"Imported via drop: {script_name}")
                     except Exception as e:
@@ -388,26 +584,22 @@ class PyLauncherApp(ctk.CTk):
 
     def _setup_taskbar_icon(self) -> None:
         """Show the borderless window in the taskbar with an icon (Windows)."""
-        import sys
-
         try:
             ico_path = get_app_icon_path()
             self.iconbitmap(str(ico_path))
         except Exception:
             pass
 
-        if sys.platform == "win32":
+        if _user32 is not None:
             try:
-                import ctypes
-
                 GWL_EXSTYLE = -20
                 WS_EX_APPWINDOW = 0x00040000
                 WS_EX_TOOLWINDOW = 0x00000080
 
-                hwnd = ctypes.windll.user32.GetParent(self.winfo_id())
-                style = ctypes.windll.user32.GetWindowLongW(hwnd, GWL_EXSTYLE)
+                hwnd = _user32.GetParent(self.winfo_id())
+                style = _user32.GetWindowLongW(hwnd, GWL_EXSTYLE)
                 style = (style | WS_EX_APPWINDOW) & ~WS_EX_TOOLWINDOW
-                ctypes.windll.user32.SetWindowLongW(hwnd, GWL_EXSTYLE, style)
+                _user32.SetWindowLongW(hwnd, GWL_EXSTYLE, style)
                 # Re-show to apply the style change
                 self.withdraw()
                 self.after(10, self.deiconify)
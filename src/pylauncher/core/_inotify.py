@@ -0,0 +1,137 @@
+"""Thin ctypes inotify wrapper for the Linux file-watcher backend.
+
+One os.read() delivers a whole batch of kernel events, and the watch
+mask limits delivery to the event kinds ScriptWatcher cares about —
+the filtering watchdog would otherwise do per-event in Python happens
+in the kernel instead.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import threading
+from pathlib import Path
+from typing import Callable
+
+# Relevant constants from <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+_WATCH_MASK = IN_CREATE | IN_DELETE | IN_MODIFY | IN_MOVED_FROM | IN_MOVED_TO
+
+# struct inotify_event header: int wd; uint32 mask, cookie, len
+_EVENT_HEADER = struct.Struct("iIII")
+
+try:
+    _libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    _libc.inotify_init1.argtypes = [ctypes.c_int]
+    _libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    _INOTIFY_AVAILABLE = True
+except (OSError, AttributeError):
+    _INOTIFY_AVAILABLE = False
+
+
+def available() -> bool:
+    """True if libc exposes the inotify syscalls (Linux only)."""
+    return _INOTIFY_AVAILABLE
+
+
+class InotifyWatcher:
+    """Watches a directory tree through raw inotify file descriptors.
+
+    Watches are added recursively at start and for directories created
+    while running. `on_event` receives (path, is_directory) for every
+    delivered event.
+    """
+
+    def __init__(self, root: Path, on_event: Callable[[str, bool], None]) -> None:
+        self._root = root
+        self._on_event = on_event
+        self._fd = -1
+        self._watches: dict[int, str] = {}
+        self._wake_r = -1
+        self._wake_w = -1
+        self._thread: threading.Thread | None = None
+        self._running = False
+
+    def start(self) -> None:
+        """Initialise the inotify fd and start the reader thread."""
+        self._fd = _libc.inotify_init1(os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._wake_r, self._wake_w = os.pipe()
+        self._add_watch_recursive(str(self._root))
+        self._running = True
+        self._thread = threading.Thread(target=self._read_loop, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the reader thread and release the file descriptors."""
+        self._running = False
+        try:
+            os.write(self._wake_w, b"x")
+        except OSError:
+            pass
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+        for fd in (self._fd, self._wake_r, self._wake_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._fd = -1
+        self._watches.clear()
+
+    def _add_watch(self, path: str) -> None:
+        wd = _libc.inotify_add_watch(self._fd, path.encode(), _WATCH_MASK)
+        if wd >= 0:
+            self._watches[wd] = path
+
+    def _add_watch_recursive(self, path: str) -> None:
+        self._add_watch(path)
+        for dirpath, dirnames, _filenames in os.walk(path):
+            for name in dirnames:
+                self._add_watch(os.path.join(dirpath, name))
+
+    def _read_loop(self) -> None:
+        while self._running:
+            ready, _, _ = select.select([self._fd, self._wake_r], [], [])
+            if not self._running or self._wake_r in ready:
+                return
+            try:
+                buf = os.read(self._fd, 65536)
+            except OSError:
+                return
+            self._dispatch(buf)
+
+    def _dispatch(self, buf: bytes) -> None:
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(buf):
+            wd, mask, _cookie, name_len = _EVENT_HEADER.unpack_from(buf, offset)
+            name_start = offset + _EVENT_HEADER.size
+            raw_name = buf[name_start : name_start + name_len]
+            offset = name_start + name_len
+
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            base = self._watches.get(wd)
+            name = raw_name.split(b"\0", 1)[0].decode("utf-8", errors="replace")
+            if base is None or not name:
+                continue
+
+            path = os.path.join(base, name)
+            is_dir = bool(mask & IN_ISDIR)
+            if is_dir and mask & (IN_CREATE | IN_MOVED_TO):
+                self._add_watch_recursive(path)
+            self._on_event(path, is_dir)
@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-import configparser
-import io
+import copy
+import os
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class AppSettings:
     """Application-level settings from settings.ini."""
 
@@ -28,18 +29,30 @@ class ScriptMeta:
     tags: str = ""
     folder_path: Path = field(default_factory=Path)
 
-    @property
+    # tag_list and schedule_display are cached: a ScriptMeta is effectively
+    # immutable after load, and both are re-read per row on every refresh.
+    # The one mutation point (schedule edits) pops the cached value.
+
+    @cached_property
     def tag_list(self) -> list[str]:
         """Return tags as a cleaned list."""
         if not self.tags:
             return []
         return [t.strip() for t in self.tags.split(",") if t.strip()]
 
+    @cached_property
+    def tags_display(self) -> str:
+        """Bracketed tag text shown in list rows (first three tags)."""
+        tags = self.tag_list
+        if not tags:
+            return ""
+        return " ".join(f"[{t}]" for t in tags[:3])
+
     @property
     def has_schedule(self) -> bool:
         return bool(self.schedule) and self.schedule.lower() != "off"
 
-    @property
+    @cached_property
     def schedule_display(self) -> str:
         """Human-readable schedule summary for UI display."""
         if not self.has_schedule:
@@ -55,80 +68,126 @@ class ScriptMeta:
         return self.schedule
 
 
+def _file_matches(path: Path, data: bytes) -> bool:
+    """True if the file already holds exactly `data`.
+
+    Saves skip the write when nothing changed — this avoids the inode
+    timestamp bump that would re-trigger the scripts-dir file watcher.
+    """
+    try:
+        return path.read_bytes() == data
+    except OSError:
+        return False
+
+
+def _parse_kv(text: str) -> dict[str, str]:
+    """Parse raw Key=Value lines into a dict with lowercased keys.
+
+    Both settings.ini and me.ini hold a tiny known schema, so a plain
+    line parser avoids configparser's interpolator/section machinery.
+    Section headers and comment lines are skipped.
+    """
+    kv: dict[str, str] = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith(("[", "#", ";")):
+            continue
+        if "=" in line:
+            key, value = line.split("=", 1)
+            kv[key.strip().lower()] = value.strip()
+    return kv
+
+
 class SettingsManager:
-    """Read/write settings.ini using configparser."""
+    """Read/write settings.ini."""
 
     def __init__(self, settings_path: Path) -> None:
         self._path = settings_path
 
     def load(self) -> AppSettings:
         """Load settings from settings.ini, creating a default file if missing."""
-        settings = AppSettings()
         if not self._path.exists():
+            settings = AppSettings()
             self.save(settings)
             return settings
 
-        config = configparser.ConfigParser()
-        config.read(str(self._path), encoding="utf-8")
-
-        section = "DEFAULT"
-        settings.python_path = config.get(section, "PythonPath", fallback="")
-        settings.chromedriver_path = config.get(section, "ChromeDriverPath", fallback="")
-        settings.googlechrome_path = config.get(section, "GoogleChromePath", fallback="")
-        return settings
+        kv = _parse_kv(self._path.read_text(encoding="utf-8"))
+        return AppSettings(
+            python_path=kv.get("pythonpath", ""),
+            chromedriver_path=kv.get("chromedriverpath", ""),
+            googlechrome_path=kv.get("googlechromepath", ""),
+        )
 
     def save(self, settings: AppSettings) -> None:
         """Save settings to settings.ini."""
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        lines = [
-            "[DEFAULT]",
-            f"PythonPath={settings.python_path}",
-            f"ChromeDriverPath={settings.chromedriver_path}",
-            f"GoogleChromePath={settings.googlechrome_path}",
-            "",
-        ]
-        self._path.write_text("\n".join(lines), encoding="utf-8")
+        data = (
+            "[DEFAULT]\n"
+            f"PythonPath={settings.python_path}\n"
+            f"ChromeDriverPath={settings.chromedriver_path}\n"
+            f"GoogleChromePath={settings.googlechrome_path}\n"
+        ).encode("utf-8")
+        if not _file_matches(self._path, data):
+            self._path.write_bytes(data)
+
+
+# Parsed me.ini files keyed by path, invalidated when (st_mtime_ns, st_size)
+# changes. discover_all() re-loads every script on each refresh, so a warm
+# cache turns N read+parse passes into N stat calls.
+_META_CACHE: dict[Path, tuple[int, int, ScriptMeta]] = {}
 
 
 class ScriptMetaManager:
     """Read/write me.ini files.
 
     me.ini files have NO section header — just raw Key=Value lines.
-    We inject a fake [DEFAULT] when reading with configparser,
-    and strip it when writing.
     """
 
     @staticmethod
     def load(folder_path: Path) -> Optional[ScriptMeta]:
         """Load me.ini from a script folder. Returns None if not found."""
         ini_path = folder_path / "me.ini"
-        if not ini_path.exists():
+        try:
+            st = os.stat(ini_path)
+        except OSError:
             return None
 
-        config = configparser.ConfigParser()
-        text = ini_path.read_text(encoding="utf-8")
-        config.read_string(f"[DEFAULT]\n{text}")
+        cached = _META_CACHE.get(ini_path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            # Copy so callers mutating the result (e.g. schedule edits)
+            # don't corrupt the cached instance.
+            return copy.copy(cached[2])
+
+        try:
+            data = ini_path.read_bytes()
+        except OSError:
+            return None
 
-        return ScriptMeta(
-            script_name=config.get("DEFAULT", "ScriptName", fallback=""),
-            main_script=config.get("DEFAULT", "MainScript", fallback=""),
-            schedule=config.get("DEFAULT", "Schedule", fallback="off"),
-            tags=config.get("DEFAULT", "Tags", fallback=""),
+        kv = _parse_kv(data.decode("utf-8"))
+        meta = ScriptMeta(
+            script_name=kv.get("scriptname", ""),
+            main_script=kv.get("mainscript", ""),
+            schedule=kv.get("schedule", "off"),
+            tags=kv.get("tags", ""),
             folder_path=folder_path,
         )
+        _META_CACHE[ini_path] = (st.st_mtime_ns, st.st_size, copy.copy(meta))
+        return meta
 
     @staticmethod
     def save(folder_path: Path, meta: ScriptMeta) -> None:
         """Save me.ini to a script folder (without section header)."""
         ini_path = folder_path / "me.ini"
-        lines = [
-            f"ScriptName={meta.script_name}",
-            f"MainScript={meta.main_script}",
-            f"Schedule={meta.schedule}",
-            f"Tags={meta.tags}",
-            "",
-        ]
-        ini_path.write_text("\n".join(lines), encoding="utf-8")
+        data = (
+            f"ScriptName={meta.script_name}\n"
+            f"MainScript={meta.main_script}\n"
+            f"Schedule={meta.schedule}\n"
+            f"Tags={meta.tags}\n"
+        ).encode("utf-8")
+        if _file_matches(ini_path, data):
+            return
+        _META_CACHE.pop(ini_path, None)
+        ini_path.write_bytes(data)
 
     @staticmethod
     def create(folder_path: Path, script_name: str, main_script: str) -> ScriptMeta:
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import threading
+import time
 from pathlib import Path
 from typing import Callable
 
+from pylauncher.core import _inotify
+
 try:
     from watchdog.observers import Observer
     from watchdog.events import FileSystemEventHandler, FileSystemEvent
@@ -16,70 +19,162 @@ except ImportError:
 
 
 class ScriptDirectoryHandler:
-    """Watches for changes in the scripts directory with debounce."""
+    """Accumulates change events and delivers one batched callback with debounce.
+
+    Events are collected into a set of changed folder keys under a condition
+    variable; a single long-lived worker thread fires the callback once the
+    directory has been quiet for `debounce_sec`. This collapses event storms
+    (git checkout, pip install into a venv under scripts/) into one refresh
+    instead of a timer create/cancel cycle per event.
+    """
 
-    def __init__(self, on_change: Callable[[], None], debounce_sec: float = 1.0) -> None:
+    # Only these paths are relevant to script discovery.
+    _WATCHED_SUFFIXES = ("me.ini", ".py")
+
+    def __init__(
+        self,
+        scripts_dir: Path,
+        on_change: Callable[[set[str]], None],
+        debounce_sec: float = 1.0,
+    ) -> None:
+        self._scripts_dir = scripts_dir
         self._on_change = on_change
         self._debounce_sec = debounce_sec
-        self._timer: threading.Timer | None = None
-        self._lock = threading.Lock()
+        self._cond = threading.Condition()
+        self._pending: set[str] = set()
+        self._last_event = 0.0
+        self._stopped = False
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
+
+    def stop(self) -> None:
+        """Stop the worker thread. Pending events are discarded."""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+
+    def _record_event(self, path: str, is_directory: bool) -> None:
+        """Stamp an event if it is relevant to script discovery."""
+        if not is_directory and not path.endswith(self._WATCHED_SUFFIXES):
+            return
+        folder_key = self._folder_key_for(path)
+        if folder_key is None:
+            return
+        with self._cond:
+            self._pending.add(folder_key)
+            self._last_event = time.monotonic()
+            self._cond.notify()
 
-    def _schedule_callback(self) -> None:
-        with self._lock:
-            if self._timer is not None:
-                self._timer.cancel()
-            self._timer = threading.Timer(self._debounce_sec, self._on_change)
-            self._timer.daemon = True
-            self._timer.start()
+    def _folder_key_for(self, path: str) -> str | None:
+        """Map an event path to its top-level script folder name."""
+        try:
+            rel = Path(path).relative_to(self._scripts_dir)
+        except ValueError:
+            return None
+        return rel.parts[0] if rel.parts else None
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                # Wait until the directory has been quiet for debounce_sec.
+                while not self._stopped:
+                    remaining = self._last_event + self._debounce_sec - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(timeout=remaining)
+                if self._stopped:
+                    return
+                changed, self._pending = self._pending, set()
+            try:
+                self._on_change(changed)
+            except Exception:
+                pass  # Callback errors must not kill the worker
 
 
 if _WATCHDOG_AVAILABLE:
 
     class _WatchdogHandler(FileSystemEventHandler, ScriptDirectoryHandler):
-        """Watchdog event handler with debounced callbacks."""
-
-        def __init__(self, on_change: Callable[[], None], debounce_sec: float = 1.0) -> None:
+        """Watchdog event handler feeding the batched debounce worker."""
+
+        def __init__(
+            self,
+            scripts_dir: Path,
+            on_change: Callable[[set[str]], None],
+            debounce_sec: float = 1.0,
+        ) -> None:
             FileSystemEventHandler.__init__(self)
-            ScriptDirectoryHandler.__init__(self, on_change, debounce_sec)
+            ScriptDirectoryHandler.__init__(self, scripts_dir, on_change, debounce_sec)
 
         def on_created(self, event: FileSystemEvent) -> None:
-            self._schedule_callback()
+            self._record_event(event.src_path, event.is_directory)
 
         def on_deleted(self, event: FileSystemEvent) -> None:
-            self._schedule_callback()
+            self._record_event(event.src_path, event.is_directory)
 
         def on_modified(self, event: FileSystemEvent) -> None:
-            if event.src_path.endswith("me.ini"):
-                self._schedule_callback()
+            # Directory-modified events fire for any content change and
+            # carry no extra information — only files matter here.
+            if not event.is_directory:
+                self._record_event(event.src_path, False)
 
 
 class ScriptWatcher:
-    """Manages a watchdog Observer for the scripts directory.
+    """Watches the scripts directory for changes.
 
-    Degrades gracefully if watchdog is not installed.
+    Uses the raw inotify backend on Linux (kernel-side event filtering,
+    batched reads) and falls back to a watchdog Observer elsewhere —
+    watchdog is already native on Windows (ReadDirectoryChangesW) and
+    macOS (FSEvents). Degrades to a no-op if neither is available.
     """
 
-    def __init__(self, scripts_dir: Path, on_change: Callable[[], None]) -> None:
+    def __init__(self, scripts_dir: Path, on_change: Callable[[set[str]], None]) -> None:
         self._scripts_dir = scripts_dir
         self._on_change = on_change
         self._observer = None
+        self._native: "_inotify.InotifyWatcher | None" = None
+        self._handler: ScriptDirectoryHandler | None = None
 
     def start(self) -> None:
-        """Start watching. No-op if watchdog is not installed."""
+        """Start watching. No-op if no backend is available."""
+        if _inotify.available():
+            try:
+                handler = ScriptDirectoryHandler(self._scripts_dir, self._on_change)
+                native = _inotify.InotifyWatcher(self._scripts_dir, handler._record_event)
+                native.start()
+                self._handler = handler
+                self._native = native
+                return
+            except OSError:
+                handler.stop()
+                self._native = None
+
         if not _WATCHDOG_AVAILABLE:
             return
         try:
-            handler = _WatchdogHandler(self._on_change)
+            self._handler = _WatchdogHandler(self._scripts_dir, self._on_change)
             self._observer = Observer()
-            self._observer.schedule(handler, str(self._scripts_dir), recursive=True)
+            self._observer.schedule(self._handler, str(self._scripts_dir), recursive=True)
             self._observer.daemon = True
             self._observer.start()
         except Exception:
+            if self._handler is not None:
+                self._handler.stop()
+                self._handler = None
             self._observer = None
 
     def stop(self) -> None:
         """Stop watching."""
+        if self._native is not None:
+            self._native.stop()
+            self._native = None
         if self._observer is not None:
             self._observer.stop()
             self._observer.join(timeout=2)
             self._observer = None
+        if self._handler is not None:
+            self._handler.stop()
+            self._handler = None
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import selectors
 import subprocess
 import sys
 import threading
+import time
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from pathlib import Path
@@ -33,21 +35,37 @@ class RunningProcess:
 class ProcessHandler:
     """Manages all running script processes."""
 
+    BATCH_MAX_LINES = 64  # flush an output batch at this many lines...
+    BATCH_INTERVAL = 0.05  # ...or this many seconds, whichever first
+    VENV_CACHE_TTL = 30.0  # seconds before re-statting a folder's venv python
+
     def __init__(self, python_path: str) -> None:
         self._python_path = python_path
         self._processes: dict[str, RunningProcess] = {}
+        # Parallel running-state views so is_running / tray enumeration
+        # don't scan every RunningProcess record.
+        self._running_keys: set[str] = set()
+        self._running_names: dict[str, str] = {}
+        self._venv_cache: dict[Path, tuple[float, str]] = {}
         self._lock = threading.Lock()
 
     def update_python_path(self, python_path: str) -> None:
         """Update the Python executable path."""
         self._python_path = python_path
+        with self._lock:
+            self._venv_cache.clear()
+
+    def invalidate_venv(self, folder_path: Path) -> None:
+        """Forget a folder's cached interpreter (after venv create/delete)."""
+        with self._lock:
+            self._venv_cache.pop(folder_path, None)
 
     def start_script(
         self,
         folder_path: Path,
         main_script: str,
         script_name: str,
-        on_output: Callable[[str, str], None],
+        on_output: Callable[[str, list[str]], None],
         on_exit: Callable[[str, int], None],
     ) -> str:
         """Launch a script in a subprocess.
@@ -56,7 +74,7 @@ class ProcessHandler:
             folder_path: Script folder (used as working directory)
             main_script: The .py filename to run
             script_name: Display name for tracking
-            on_output: Called with (folder_key, line) for each output line
+            on_output: Called with (folder_key, lines) per batch of output
             on_exit: Called with (folder_key, return_code) when process exits
 
         Returns:
@@ -65,10 +83,8 @@ class ProcessHandler:
         folder_key = folder_path.name
 
         with self._lock:
-            if folder_key in self._processes:
-                existing = self._processes[folder_key]
-                if existing.state == ProcessState.RUNNING:
-                    return folder_key  # Already running
+            if folder_key in self._running_keys:
+                return folder_key  # Already running
 
         # Determine python executable — prefer venv if available
         python_exe = self._get_python_exe(folder_path)
@@ -85,6 +101,7 @@ class ProcessHandler:
             stderr=subprocess.STDOUT,
             cwd=str(folder_path),
             creationflags=creation_flags,
+            bufsize=65536,
         )
 
         rp = RunningProcess(
@@ -104,6 +121,8 @@ class ProcessHandler:
 
         with self._lock:
             self._processes[folder_key] = rp
+            self._running_keys.add(folder_key)
+            self._running_names[folder_key] = script_name
 
         reader.start()
         return folder_key
@@ -115,6 +134,8 @@ class ProcessHandler:
             if rp is None or rp.state != ProcessState.RUNNING:
                 return
             rp.state = ProcessState.STOPPING
+            self._running_keys.discard(folder_key)
+            self._running_names.pop(folder_key, None)
 
         proc = rp.process
         if proc is None:
@@ -133,29 +154,24 @@ class ProcessHandler:
         with self._lock:
             rp.state = ProcessState.STOPPED
 
+    # The read paths below are deliberately lock-free: membership tests
+    # and list()/dict-values snapshots are single C-level operations
+    # under the GIL, and the running views are only mutated inside
+    # locked state transitions. This keeps the scheduler's is_running
+    # polls and the tray's name enumeration from contending with
+    # reader-thread exits.
+
     def is_running(self, folder_key: str) -> bool:
         """Check if a script is currently running."""
-        with self._lock:
-            rp = self._processes.get(folder_key)
-            return rp is not None and rp.state == ProcessState.RUNNING
+        return folder_key in self._running_keys
 
     def get_running_keys(self) -> list[str]:
         """Get all currently running script folder keys."""
-        with self._lock:
-            return [
-                key
-                for key, rp in self._processes.items()
-                if rp.state == ProcessState.RUNNING
-            ]
+        return list(self._running_keys)
 
     def get_running_names(self) -> list[str]:
         """Get display names of all currently running scripts."""
-        with self._lock:
-            return [
-                rp.script_name
-                for rp in self._processes.values()
-                if rp.state == ProcessState.RUNNING
-            ]
+        return list(self._running_names.values())
 
     def stop_all(self) -> None:
         """Kill all running processes."""
@@ -168,35 +184,44 @@ class ProcessHandler:
         self.stop_all()
 
     def _get_python_exe(self, folder_path: Path) -> str:
-        """Get the Python executable path, preferring venv if it exists."""
+        """Get the Python executable path, preferring venv if it exists.
+
+        Results are cached briefly so scheduled restarts don't re-stat
+        the venv path (expensive on OneDrive/network mounts) every time.
+        """
+        now = time.monotonic()
+        with self._lock:
+            cached = self._venv_cache.get(folder_path)
+            if cached is not None and now - cached[0] < self.VENV_CACHE_TTL:
+                return cached[1]
+
         if sys.platform == "win32":
             venv_python = folder_path / "venv" / "Scripts" / "python.exe"
         else:
             venv_python = folder_path / "venv" / "bin" / "python"
 
-        if venv_python.exists():
-            return str(venv_python)
-        return self._python_path
+        exe = str(venv_python) if venv_python.exists() else self._python_path
+        with self._lock:
+            self._venv_cache[folder_path] = (now, exe)
+        return exe
 
     def _reader_thread(
         self,
         rp: RunningProcess,
         folder_key: str,
-        on_output: Callable[[str, str], None],
+        on_output: Callable[[str, list[str]], None],
         on_exit: Callable[[str, int], None],
     ) -> None:
-        """Background thread that reads stdout line-by-line."""
+        """Background thread that pumps stdout to on_output in batches."""
         proc = rp.process
         if proc is None or proc.stdout is None:
             return
 
         try:
-            for line_bytes in iter(proc.stdout.readline, b""):
-                if rp.state == ProcessState.STOPPING:
-                    break
-                decoded = line_bytes.decode("utf-8", errors="replace").rstrip()
-                if decoded:
-                    on_output(folder_key, decoded)
+            if sys.platform == "win32":
+                self._pump_blocking(rp, folder_key, on_output)
+            else:
+                self._pump_select(rp, folder_key, on_output)
         except (OSError, ValueError):
             pass  # Stream closed
 
@@ -205,5 +230,91 @@ class ProcessHandler:
         with self._lock:
             if rp.state != ProcessState.STOPPING:
                 rp.state = ProcessState.STOPPED
+            self._running_keys.discard(folder_key)
+            self._running_names.pop(folder_key, None)
 
         on_exit(folder_key, rc)
+
+    def _pump_select(
+        self,
+        rp: RunningProcess,
+        folder_key: str,
+        on_output: Callable[[str, list[str]], None],
+    ) -> None:
+        """POSIX output pump: select with a timeout keeps the STOPPING
+        check responsive and flushes quiet batches promptly.
+        """
+        stdout = rp.process.stdout
+        sel = selectors.DefaultSelector()
+        sel.register(stdout, selectors.EVENT_READ)
+        batch: list[str] = []
+        buf = b""
+        last_flush = time.monotonic()
+        try:
+            while rp.state != ProcessState.STOPPING:
+                ready = sel.select(timeout=self.BATCH_INTERVAL)
+                now = time.monotonic()
+                if ready:
+                    chunk = stdout.read1(65536)
+                    if not chunk:
+                        break
+                    buf += chunk
+                    *complete, buf = buf.split(b"\n")
+                    for raw in complete:
+                        # Trim the line ending at the bytes level — no
+                        # post-decode rstrip allocation per line.
+                        raw = raw.removesuffix(b"\r")
+                        if raw:
+                            batch.append(raw.decode("utf-8", errors="replace"))
+                if batch and (
+                    len(batch) >= self.BATCH_MAX_LINES
+                    or now - last_flush >= self.BATCH_INTERVAL
+                ):
+                    on_output(folder_key, batch)
+                    batch = []
+                    last_flush = now
+        finally:
+            sel.close()
+
+        tail = buf.removesuffix(b"\r")
+        if tail:
+            batch.append(tail.decode("utf-8", errors="replace"))
+        if batch:
+            on_output(folder_key, batch)
+
+    def _pump_blocking(
+        self,
+        rp: RunningProcess,
+        folder_key: str,
+        on_output: Callable[[str, list[str]], None],
+    ) -> None:
+        """Windows output pump: select() doesn't work on pipes, so read
+        blocking chunks and flush each chunk's complete lines before
+        blocking again — a quiet stream never strands a partial batch
+        behind an age check that only runs after the next read.
+        """
+        stdout = rp.process.stdout
+        batch: list[str] = []
+        buf = b""
+        while rp.state != ProcessState.STOPPING:
+            chunk = stdout.read1(65536)
+            if not chunk:
+                break
+            buf += chunk
+            *complete, buf = buf.split(b"\n")
+            for raw in complete:
+                raw = raw.removesuffix(b"\r")
+                if raw:
+                    batch.append(raw.decode("utf-8", errors="replace"))
+                    if len(batch) >= self.BATCH_MAX_LINES:
+                        on_output(folder_key, batch)
+                        batch = []
+            if batch:
+                on_output(folder_key, batch)
+                batch = []
+
+        tail = buf.removesuffix(b"\r")
+        if tail:
+            batch.append(tail.decode("utf-8", errors="replace"))
+        if batch:
+            on_output(folder_key, batch)
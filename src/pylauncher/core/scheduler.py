@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import math
+import re
 import threading
 import time
-from dataclasses import dataclass, field
-from datetime import datetime
+from dataclasses import dataclass
 from enum import Enum, auto
+from functools import lru_cache
 from typing import Callable, Optional
 
 
@@ -19,13 +21,24 @@ class ScheduleType(Enum):
 
 _DAY_MAP = {"mon": 0, "tue": 1, "wed": 2, "thu": 3, "fri": 4, "sat": 5, "sun": 6}
 
+# \s* around the separators: the baseline strip()ed every |-split part,
+# so hand-edited files like "daily | 09:00" must keep parsing.
+_SCHED_RE = re.compile(r"^(daily|interval|weekdays)\s*\|\s*([^|]+)(?:\|\s*([^|]+))?$", re.I)
 
+
+# The same schedule strings repeat across folders ("daily|09:00" etc.),
+# so cached parses turn reload work into dict lookups. All three take a
+# single str and return immutable values — safe to share.
+
+
+@lru_cache(maxsize=256)
 def _parse_time(s: str) -> tuple[int, int]:
     """Parse 'HH:MM' -> (hour, minute)."""
     h_str, m_str = s.strip().split(":")
     return int(h_str), int(m_str)
 
 
+@lru_cache(maxsize=256)
 def _parse_interval(s: str) -> int:
     """Parse '30m' or '2h' -> seconds."""
     s = s.strip().lower()
@@ -36,14 +49,15 @@ def _parse_interval(s: str) -> int:
     return int(s) * 60  # Default to minutes
 
 
-def _parse_weekdays(s: str) -> list[int]:
-    """Parse 'mon,wed,fri' -> [0, 2, 4]."""
-    result = []
-    for day_str in s.lower().split(","):
-        day_str = day_str.strip()
-        if day_str in _DAY_MAP:
-            result.append(_DAY_MAP[day_str])
-    return sorted(set(result))
+@lru_cache(maxsize=256)
+def _parse_weekdays(s: str) -> tuple[int, ...]:
+    """Parse 'mon,wed,fri' -> (0, 2, 4)."""
+    day_map = _DAY_MAP
+    return tuple(
+        sorted(
+            {day_map[d] for d in (p.strip() for p in s.lower().split(",")) if d in day_map}
+        )
+    )
 
 
 @dataclass
@@ -53,37 +67,56 @@ class ScheduleEntry:
     schedule_type: ScheduleType = ScheduleType.OFF
     time_of_day: Optional[tuple[int, int]] = None
     interval_seconds: int = 0
-    weekdays: list[int] = field(default_factory=list)
+    weekdays: tuple[int, ...] = ()
 
     @staticmethod
     def parse(raw: str) -> ScheduleEntry:
         """Parse a schedule string like 'daily|09:30' into a ScheduleEntry."""
-        if not raw or raw.lower() == "off":
-            return ScheduleEntry()
-        parts = raw.split("|")
-        stype = parts[0].lower().strip()
+        match = _SCHED_RE.match(raw.strip()) if raw else None
+        if match is None:
+            return ScheduleEntry()  # "off", empty, or malformed
         try:
-            if stype == "daily" and len(parts) >= 2:
-                h, m = _parse_time(parts[1])
-                return ScheduleEntry(schedule_type=ScheduleType.DAILY, time_of_day=(h, m))
-            elif stype == "interval" and len(parts) >= 2:
-                seconds = _parse_interval(parts[1])
-                return ScheduleEntry(schedule_type=ScheduleType.INTERVAL, interval_seconds=seconds)
-            elif stype == "weekdays" and len(parts) >= 3:
-                h, m = _parse_time(parts[1])
-                days = _parse_weekdays(parts[2])
-                return ScheduleEntry(
-                    schedule_type=ScheduleType.WEEKDAYS, time_of_day=(h, m), weekdays=days
-                )
+            return _PARSERS[match.group(1).lower()](match)
         except (ValueError, IndexError):
-            pass
+            return ScheduleEntry()
+
+
+def _entry_daily(match: "re.Match[str]") -> ScheduleEntry:
+    return ScheduleEntry(
+        schedule_type=ScheduleType.DAILY, time_of_day=_parse_time(match.group(2))
+    )
+
+
+def _entry_interval(match: "re.Match[str]") -> ScheduleEntry:
+    return ScheduleEntry(
+        schedule_type=ScheduleType.INTERVAL, interval_seconds=_parse_interval(match.group(2))
+    )
+
+
+def _entry_weekdays(match: "re.Match[str]") -> ScheduleEntry:
+    if match.group(3) is None:
         return ScheduleEntry()
+    return ScheduleEntry(
+        schedule_type=ScheduleType.WEEKDAYS,
+        time_of_day=_parse_time(match.group(2)),
+        weekdays=_parse_weekdays(match.group(3)),
+    )
+
+
+# One precompiled match + table dispatch instead of an if/elif chain of
+# lower()/split() passes per parse.
+_PARSERS: dict[str, Callable[["re.Match[str]"], ScheduleEntry]] = {
+    "daily": _entry_daily,
+    "interval": _entry_interval,
+    "weekdays": _entry_weekdays,
+}
 
 
 class Scheduler:
     """Background scheduler that checks script schedules and triggers starts."""
 
-    POLL_INTERVAL = 30  # seconds between checks
+    MAX_WAIT = 600  # re-check at least this often (clock jumps, suspend)
+    MIN_WAIT = 0.5
 
     def __init__(
         self,
@@ -96,9 +129,22 @@ class Scheduler:
         self._on_log = on_log
 
         self._schedules: dict[str, ScheduleEntry] = {}
-        self._last_fired: dict[str, datetime] = {}
+        # Immutable copy-on-write view of _schedules: writers rebuild it
+        # under the lock, the poller reads it without locking (tuple
+        # assignment is atomic in CPython).
+        self._schedules_view: tuple[tuple[str, ScheduleEntry], ...] = ()
+        # Raw schedule strings as last seen, so reloads only re-parse
+        # entries that actually changed.
+        self._raw_schedules: dict[str, str] = {}
+        # Last fire times as epoch seconds — float math in the poll
+        # loop instead of datetime allocation and subtraction.
+        self._last_fired: dict[str, float] = {}
+        # Epoch time of the earliest potential fire; the poll loop
+        # sleeps until then instead of waking every fixed interval.
+        self._next_due: float = math.inf
         self._lock = threading.Lock()
         self._running = False
+        self._wake_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
 
     def update_schedule(self, folder_key: str, raw_schedule: str) -> None:
@@ -107,36 +153,68 @@ class Scheduler:
             if entry.schedule_type == ScheduleType.OFF:
                 self._schedules.pop(folder_key, None)
                 self._last_fired.pop(folder_key, None)
+                self._raw_schedules.pop(folder_key, None)
             else:
                 self._schedules[folder_key] = entry
+                self._raw_schedules[folder_key] = raw_schedule
+            self._schedules_view = tuple(self._schedules.items())
+        self._recompute_next_due()
 
     def remove_schedule(self, folder_key: str) -> None:
         with self._lock:
             self._schedules.pop(folder_key, None)
             self._last_fired.pop(folder_key, None)
+            self._raw_schedules.pop(folder_key, None)
+            self._schedules_view = tuple(self._schedules.items())
+        self._recompute_next_due()
 
     def load_all(self, schedule_map: dict[str, str]) -> None:
+        """Load schedules, re-parsing only entries that changed."""
         with self._lock:
-            self._schedules.clear()
-            self._last_fired.clear()
-        for folder_key, raw in schedule_map.items():
-            self.update_schedule(folder_key, raw)
+            if schedule_map == self._raw_schedules:
+                return
+            removed = self._raw_schedules.keys() - schedule_map.keys()
+            changed = {
+                key: raw
+                for key, raw in schedule_map.items()
+                if self._raw_schedules.get(key) != raw
+            }
+
+        parsed = {key: ScheduleEntry.parse(raw) for key, raw in changed.items()}
+        with self._lock:
+            self._raw_schedules = dict(schedule_map)
+            for key in removed:
+                self._schedules.pop(key, None)
+                self._last_fired.pop(key, None)
+            for key, entry in parsed.items():
+                if entry.schedule_type == ScheduleType.OFF:
+                    self._schedules.pop(key, None)
+                    self._last_fired.pop(key, None)
+                    self._raw_schedules.pop(key, None)
+                else:
+                    self._schedules[key] = entry
+                    self._last_fired.pop(key, None)
+            self._schedules_view = tuple(self._schedules.items())
+        self._recompute_next_due()
 
     def start(self) -> None:
         if self._running:
             return
         self._running = True
+        self._wake_event.clear()
         self._thread = threading.Thread(target=self._poll_loop, daemon=True)
         self._thread.start()
 
     def stop(self) -> None:
         self._running = False
+        self._wake_event.set()
         if self._thread is not None:
             self._thread.join(timeout=5)
             self._thread = None
 
     def _poll_loop(self) -> None:
         while self._running:
+            self._wake_event.clear()
             try:
                 self._check_all()
             except Exception as e:
@@ -144,61 +222,122 @@ class Scheduler:
                     self._on_log(f"Scheduler error: {e}")
                 except Exception:
                     pass
-            # Sleep in small increments so stop() is responsive
-            for _ in range(self.POLL_INTERVAL * 2):
-                if not self._running:
-                    return
-                time.sleep(0.5)
+            # Sleep until the earliest schedule could fire; schedule
+            # writers and stop() set the event to wake the loop early.
+            delay = self._next_due - time.time()
+            self._wake_event.wait(min(max(delay, self.MIN_WAIT), self.MAX_WAIT))
 
     def _check_all(self) -> None:
-        now = datetime.now()
-        with self._lock:
-            entries = dict(self._schedules)
+        # Lock-free read of the CoW view; _last_fired values are only
+        # written by this thread, so the .get() reads are safe too.
+        view = self._schedules_view
+        if not view:
+            return
 
-        for folder_key, entry in entries.items():
-            if self._should_fire(folder_key, entry, now):
-                if not self._is_running(folder_key):
-                    with self._lock:
-                        self._last_fired[folder_key] = now
-                    self._on_trigger(folder_key)
+        now_ts = time.time()
+        now_struct = time.localtime(now_ts)
 
-    def _should_fire(self, folder_key: str, entry: ScheduleEntry, now: datetime) -> bool:
-        with self._lock:
+        fired: list[str] = []
+        for folder_key, entry in view:
             last = self._last_fired.get(folder_key)
+            if self._should_fire(entry, now_ts, now_struct, last) and not self._is_running(
+                folder_key
+            ):
+                fired.append(folder_key)
+
+        if fired:
+            with self._lock:
+                for folder_key in fired:
+                    self._last_fired[folder_key] = now_ts
+            for folder_key in fired:
+                self._on_trigger(folder_key)
+
+        self._recompute_next_due(now_ts, wake=False)
+
+    def _recompute_next_due(self, now_ts: Optional[float] = None, wake: bool = True) -> None:
+        """Refresh the earliest potential fire time across all schedules.
+
+        Writer paths leave wake=True so a sleeping loop picks up a
+        newly added near-term schedule; the poll thread itself passes
+        wake=False — setting the event from inside the loop would make
+        every wait() return immediately and spin the poller hot.
+        """
+        if now_ts is None:
+            now_ts = time.time()
+        due = math.inf
+        for key, entry in self._schedules_view:
+            due = min(due, self._entry_next_due(entry, self._last_fired.get(key), now_ts))
+        self._next_due = due
+        if wake and self._running:
+            self._wake_event.set()
+
+    @staticmethod
+    def _entry_next_due(
+        entry: ScheduleEntry, last: Optional[float], now_ts: float
+    ) -> float:
+        """Epoch time at which this entry could fire next."""
+        if entry.schedule_type == ScheduleType.INTERVAL:
+            return now_ts if last is None else last + entry.interval_seconds
+        if entry.time_of_day is None:
+            return math.inf
+        target_h, target_m = entry.time_of_day
+        st = time.localtime(now_ts)
+        for offset in range(8):  # today plus a full weekday cycle
+            candidate = time.mktime(
+                (st.tm_year, st.tm_mon, st.tm_mday + offset, target_h, target_m, 0, 0, 0, -1)
+            )
+            if (
+                entry.schedule_type == ScheduleType.WEEKDAYS
+                and time.localtime(candidate).tm_wday not in entry.weekdays
+            ):
+                continue
+            if candidate + 60 <= now_ts:
+                continue  # that day's one-minute window already passed
+            if last is not None and candidate <= last < candidate + 60:
+                continue  # already fired in this window
+            return max(candidate, now_ts)
+        return math.inf  # e.g. weekdays entry with no days selected
 
+    @staticmethod
+    def _should_fire(
+        entry: ScheduleEntry,
+        now_ts: float,
+        now_struct: time.struct_time,
+        last: Optional[float],
+    ) -> bool:
         if entry.schedule_type == ScheduleType.DAILY:
-            return self._check_time_trigger(entry.time_of_day, now, last)
+            return Scheduler._check_time_trigger(entry.time_of_day, now_struct, last)
 
         elif entry.schedule_type == ScheduleType.INTERVAL:
             if last is None:
                 return True
-            elapsed = (now - last).total_seconds()
-            return elapsed >= entry.interval_seconds
+            return now_ts - last >= entry.interval_seconds
 
         elif entry.schedule_type == ScheduleType.WEEKDAYS:
-            if now.weekday() not in entry.weekdays:
+            if now_struct.tm_wday not in entry.weekdays:
                 return False
-            return self._check_time_trigger(entry.time_of_day, now, last)
+            return Scheduler._check_time_trigger(entry.time_of_day, now_struct, last)
 
         return False
 
     @staticmethod
     def _check_time_trigger(
         time_of_day: Optional[tuple[int, int]],
-        now: datetime,
-        last_fired: Optional[datetime],
+        now_struct: time.struct_time,
+        last_fired: Optional[float],
     ) -> bool:
         if time_of_day is None:
             return False
         target_h, target_m = time_of_day
-        if now.hour != target_h or now.minute != target_m:
+        if now_struct.tm_hour != target_h or now_struct.tm_min != target_m:
             return False
         if last_fired is None:
             return True
+        last_struct = time.localtime(last_fired)
         return not (
-            last_fired.year == now.year
-            and last_fired.month == now.month
-            and last_fired.day == now.day
-            and last_fired.hour == now.hour
-            and last_fired.minute == now.minute
+            last_struct.tm_year == now_struct.tm_year
+            and last_struct.tm_mon == now_struct.tm_mon
+            and last_struct.tm_mday == now_struct.tm_mday
+            and last_struct.tm_hour == now_struct.tm_hour
+            and last_struct.tm_min == now_struct.tm_min
         )
@@ -10,13 +10,37 @@ import subprocess
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Iterator, Optional
 
 from pylauncher.core.config import ScriptMeta, ScriptMetaManager
 
 
+def _copy_file(src: str, dst: str) -> str:
+    """copytree copy_function using os.copy_file_range when available.
+
+    On reflink/CoW-capable filesystems (btrfs, XFS, Dev Drive) the kernel
+    turns this into a metadata operation instead of moving every byte.
+    Falls back to shutil.copy2 on filesystems that refuse (EXDEV etc.).
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            shutil.copystat(src, dst)
+            return dst
+        except OSError:
+            pass
+    return shutil.copy2(src, dst)
+
+
 @dataclass
 class ScriptInfo:
     """Full representation of a discovered script."""
@@ -35,46 +59,96 @@ class ScriptManager:
         self._scripts_dir = scripts_dir
         self._scripts_dir.mkdir(parents=True, exist_ok=True)
 
+        # Parallel arrays mirroring the last discover_all() pass. Scans
+        # that only need a column (schedule checks) walk these instead
+        # of chasing ScriptInfo attribute chains.
+        self._keys: list[str] = []
+        self._schedules: list[str] = []
+
     @property
     def scripts_dir(self) -> Path:
         return self._scripts_dir
 
+    @staticmethod
+    def has_py_files(folder: Path) -> bool:
+        """Check for any top-level .py file, stopping at the first match.
+
+        os.scandir reuses the readdir-cached entry type, so this avoids
+        building a Path (and often a stat call) per directory entry the
+        way Path.glob does.
+        """
+        try:
+            with os.scandir(folder) as it:
+                return any(e.name.endswith(".py") and e.is_file() for e in it)
+        except OSError:
+            return False
+
     def discover_all(self) -> list[ScriptInfo]:
         """Scan scripts/ directory and return all valid script entries."""
         scripts: list[ScriptInfo] = []
-        if not self._scripts_dir.exists():
+        try:
+            with os.scandir(self._scripts_dir) as it:
+                folders = sorted(
+                    (Path(e.path) for e in it if e.is_dir()),
+                    key=lambda f: f.name.lower(),
+                )
+        except OSError:
             return scripts
 
-        folders = sorted(
-            [f for f in self._scripts_dir.iterdir() if f.is_dir()],
-            key=lambda f: f.name.lower(),
-        )
-
         row_num = 0
         for folder in folders:
             meta = ScriptMetaManager.load(folder)
             if meta is None:
                 continue
 
+            # One scandir pass per folder collects everything the entry
+            # needs — first .py, requirements.txt, venv — instead of a
+            # glob plus two stat probes.
+            first_py = ""
+            has_requirements = False
+            has_venv = False
+            try:
+                with os.scandir(folder) as folder_it:
+                    for entry in folder_it:
+                        name = entry.name
+                        if name == "requirements.txt" and entry.is_file():
+                            has_requirements = True
+                        elif name == "venv" and entry.is_dir():
+                            has_venv = True
+                        elif not first_py and name.endswith(".py") and entry.is_file():
+                            first_py = name
+            except OSError:
+                continue
+
             # Auto-detect main script if not set
             if not meta.main_script:
-                py_files = list(folder.glob("*.py"))
-                if py_files:
-                    meta.main_script = py_files[0].name
+                meta.main_script = first_py
 
             row_num += 1
             scripts.append(
                 ScriptInfo(
                     meta=meta,
                     folder_path=folder,
-                    has_requirements=(folder / "requirements.txt").exists(),
-                    has_venv=(folder / "venv").is_dir(),
+                    has_requirements=has_requirements,
+                    has_venv=has_venv,
                     row_number=row_num,
                 )
             )
 
+        self._keys = [s.folder_path.name for s in scripts]
+        self._schedules = [s.meta.schedule for s in scripts]
         return scripts
 
+    def iter_scheduled(self) -> Iterator[tuple[str, str]]:
+        """Yield (folder_key, schedule) pairs from the last discover pass.
+
+        Walks the parallel arrays, so building the scheduler map costs a
+        zip instead of three attribute lookups per script.
+        """
+        for key, schedule in zip(self._keys, self._schedules):
+            if schedule and schedule.lower() != "off":
+                yield key, schedule
+
     def import_script(
         self,
         source_folder: Path,
@@ -98,6 +172,8 @@ class ScriptManager:
             source_folder,
             dest_folder,
             ignore=shutil.ignore_patterns("__pycache__", ".venv", "venv", "*.pyc"),
+            copy_function=_copy_file,
+            dirs_exist_ok=False,
         )
 
         # Detect main script
@@ -127,8 +203,10 @@ class ScriptManager:
         if not folder.exists():
             return
 
-        # Remove contents first
-        shutil.rmtree(folder, onerror=self._on_rm_error)
+        # A venv can hold tens of thousands of files; prefer one
+        # platform call over a Python-level walk with per-file unlinks.
+        if not self._delete_native(folder):
+            shutil.rmtree(folder, onerror=self._on_rm_error)
 
         # OneDrive may keep the empty directory locked briefly — retry removal
         for _ in range(5):
@@ -140,6 +218,47 @@ class ScriptManager:
             except OSError:
                 time.sleep(0.5)
 
+    @staticmethod
+    def _delete_native(folder: Path) -> bool:
+        """Delete a tree with one platform call (kernel-side walk).
+
+        SHFileOperationW on Windows, rm -rf elsewhere. Returns False when
+        the fast path is unavailable or incomplete so the caller can fall
+        back to shutil.rmtree with its read-only fix-ups.
+        """
+        try:
+            if sys.platform == "win32":
+                import ctypes
+
+                class _SHFILEOPSTRUCTW(ctypes.Structure):
+                    _fields_ = [
+                        ("hwnd", ctypes.c_void_p),
+                        ("wFunc", ctypes.c_uint),
+                        ("pFrom", ctypes.c_wchar_p),
+                        ("pTo", ctypes.c_wchar_p),
+                        ("fFlags", ctypes.c_ushort),
+                        ("fAnyOperationsAborted", ctypes.c_int),
+                        ("hNameMappings", ctypes.c_void_p),
+                        ("lpszProgressTitle", ctypes.c_wchar_p),
+                    ]
+
+                FO_DELETE = 3
+                FOF_NO_UI = 0x0614  # silent, no confirmation, no error UI
+
+                op = _SHFILEOPSTRUCTW()
+                op.wFunc = FO_DELETE
+                op.pFrom = str(folder) + "\0"  # double-null terminated
+                op.fFlags = FOF_NO_UI
+                result = ctypes.windll.shell32.SHFileOperationW(ctypes.byref(op))
+                return result == 0 and not folder.exists()
+
+            result = subprocess.run(
+                ["rm", "-rf", str(folder)], capture_output=True
+            )
+            return result.returncode == 0 and not folder.exists()
+        except Exception:
+            return False
+
     @staticmethod
     def _on_rm_error(func, path, _exc_info) -> None:
         """Handle rmtree errors — clear read-only flags and retry (OneDrive compat)."""
@@ -164,8 +283,9 @@ class ScriptManager:
         python_path: str,
         on_output: Optional[Callable[[str], None]] = None,
         on_complete: Optional[Callable[[bool], None]] = None,
+        pool: Optional[ThreadPoolExecutor] = None,
     ) -> None:
-        """Run pipreqs to auto-generate requirements.txt in a background thread."""
+        """Run pipreqs to auto-generate requirements.txt in the background."""
 
         def _run() -> None:
             creation_flags = 0
@@ -201,4 +321,7 @@ class ScriptManager:
                 if on_complete:
                     on_complete(False)
 
-        threading.Thread(target=_run, daemon=True).start()
+        if pool is not None:
+            pool.submit(_run)
+        else:
+            threading.Thread(target=_run, daemon=True).start()
@@ -3,9 +3,29 @@
 from __future__ import annotations
 
 import json
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
 
+try:
+    import orjson  # C-level encoder, bytes in/out — optional
+
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+
+def _dumps(data: dict) -> bytes:
+    if _ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+def _loads(data: bytes) -> dict:
+    if _ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 @dataclass
 class AppState:
@@ -25,18 +45,20 @@ class StateManager:
         if not self._path.exists():
             return AppState()
         try:
-            data = json.loads(self._path.read_text(encoding="utf-8"))
+            data = _loads(self._path.read_bytes())
             return AppState(running_scripts=data.get("running_scripts", []))
-        except (json.JSONDecodeError, KeyError, TypeError):
+        except (ValueError, KeyError, TypeError):
             return AppState()
 
     def save(self, state: AppState) -> None:
-        """Save state to file."""
+        """Save state to file via write-to-temp + atomic rename."""
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        self._path.write_text(
-            json.dumps({"running_scripts": state.running_scripts}, indent=2),
-            encoding="utf-8",
-        )
+        tmp_path = self._path.with_suffix(".json.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_dumps({"running_scripts": state.running_scripts}))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._path)
 
     def clear(self) -> None:
         """Delete state file."""
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import threading
+from functools import lru_cache
 from typing import Callable
 
 try:
@@ -15,14 +16,32 @@ except ImportError:
     _PYSTRAY_AVAILABLE = False
 
 
+_DEFAULT_ICON: "Image.Image | None" = None
+
+
 def _create_default_icon() -> "Image.Image":
-    """Create a simple DeepPink circle icon for the tray."""
-    size = 64
-    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    draw.ellipse([4, 4, size - 4, size - 4], fill="#FF1493")
-    draw.text((size // 2 - 8, size // 2 - 10), "P", fill="white")
-    return img
+    """Create (once) a simple DeepPink circle icon for the tray."""
+    global _DEFAULT_ICON
+    if _DEFAULT_ICON is None:
+        size = 64
+        img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
+        draw.ellipse([4, 4, size - 4, size - 4], fill="#FF1493")
+        draw.text((size // 2 - 8, size // 2 - 10), "P", fill="white")
+        _DEFAULT_ICON = img
+    return _DEFAULT_ICON.copy()
+
+
+@lru_cache(maxsize=4)
+def _load_icon_image(icon_path: str) -> "Image.Image":
+    """Load a custom tray icon, memoized per path."""
+    return Image.open(icon_path)
+
+
+@lru_cache(maxsize=64)
+def _running_item(name: str) -> "MenuItem":
+    """Disabled menu entry for a running script, shared across rebuilds."""
+    return MenuItem(name, None, enabled=False)
 
 
 class TrayManager:
@@ -31,6 +50,8 @@ class TrayManager:
     Degrades gracefully if pystray is not installed.
     """
 
+    UPDATE_DEBOUNCE_SEC = 0.2  # coalesce bursts of menu rebuilds
+
     def __init__(
         self,
         on_show: Callable[[], None],
@@ -43,6 +64,11 @@ class TrayManager:
         self._get_running_names = get_running_names
         self._icon_path = icon_path
         self._icon: "pystray.Icon | None" = None
+        self._pending_update: threading.Timer | None = None
+        self._update_lock = threading.Lock()
+        self._static_head: tuple = ()
+        self._static_tail: tuple = ()
+        self._last_names: "tuple[str, ...] | None" = None
 
     @property
     def available(self) -> bool:
@@ -55,12 +81,22 @@ class TrayManager:
 
         try:
             if self._icon_path:
-                image = Image.open(self._icon_path)
+                image = _load_icon_image(self._icon_path)
             else:
                 image = _create_default_icon()
         except Exception:
             image = _create_default_icon()
 
+        # The Show/Exit entries never change — build them once.
+        self._static_head = (
+            MenuItem("Show PyLauncher", lambda: self._on_show(), default=True),
+            Menu.SEPARATOR,
+        )
+        self._static_tail = (
+            Menu.SEPARATOR,
+            MenuItem("Exit", lambda: self._on_exit()),
+        )
+
         self._icon = pystray.Icon(
             "PyLauncher",
             image,
@@ -71,24 +107,42 @@ class TrayManager:
         thread.start()
 
     def _build_menu(self) -> "Menu":
-        running = self._get_running_names()
+        running = tuple(sorted(self._get_running_names()))
+        self._last_names = running
         running_items = (
-            [MenuItem(name, None, enabled=False) for name in running]
+            [_running_item(name) for name in running]
             if running
-            else [MenuItem("(none)", None, enabled=False)]
+            else [_running_item("(none)")]
         )
 
         return Menu(
-            MenuItem("Show PyLauncher", lambda: self._on_show(), default=True),
-            Menu.SEPARATOR,
+            *self._static_head,
             MenuItem("Running Scripts", Menu(*running_items)),
-            Menu.SEPARATOR,
-            MenuItem("Exit", lambda: self._on_exit()),
+            *self._static_tail,
         )
 
     def update_menu(self) -> None:
-        """Refresh the tray menu (e.g., after scripts start/stop)."""
+        """Schedule a tray menu refresh, coalescing rapid start/stop bursts.
+
+        A stop-all of N scripts fires N update calls; the debounce timer
+        collapses them into one rebuild against the platform tray API.
+        """
+        if self._icon is None:
+            return
+        with self._update_lock:
+            if self._pending_update is not None:
+                self._pending_update.cancel()
+            timer = threading.Timer(self.UPDATE_DEBOUNCE_SEC, self._do_update_menu)
+            timer.daemon = True
+            self._pending_update = timer
+            timer.start()
+
+    def _do_update_menu(self) -> None:
+        with self._update_lock:
+            self._pending_update = None
         if self._icon:
+            if tuple(sorted(self._get_running_names())) == self._last_names:
+                return  # menu already shows exactly these names
             self._icon.menu = self._build_menu()
             try:
                 self._icon.update_menu()
@@ -97,6 +151,10 @@ class TrayManager:
 
     def stop(self) -> None:
         """Stop the tray icon."""
+        with self._update_lock:
+            if self._pending_update is not None:
+                self._pending_update.cancel()
+                self._pending_update = None
         if self._icon:
             try:
                 self._icon.stop()
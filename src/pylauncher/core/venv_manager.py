@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import io
+import os
+import selectors
 import subprocess
 import sys
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable, Optional
 
@@ -12,8 +16,9 @@ from typing import Callable, Optional
 class VenvManager:
     """Handles venv creation and pip install for script folders."""
 
-    def __init__(self, python_path: str) -> None:
+    def __init__(self, python_path: str, pool: Optional[ThreadPoolExecutor] = None) -> None:
         self._python_path = python_path
+        self._pool = pool
 
     def update_python_path(self, python_path: str) -> None:
         """Update the Python executable path."""
@@ -24,18 +29,20 @@ class VenvManager:
         folder_path: Path,
         on_output: Callable[[str], None],
         on_complete: Callable[[bool], None],
-    ) -> threading.Thread:
-        """Install requirements.txt into script's venv on a background thread.
+    ) -> None:
+        """Install requirements.txt into script's venv in the background.
 
-        Returns the thread handle.
+        Runs on the shared I/O pool when one was provided, otherwise on a
+        dedicated daemon thread.
         """
-        thread = threading.Thread(
-            target=self._install_worker,
-            args=(folder_path, on_output, on_complete),
-            daemon=True,
-        )
-        thread.start()
-        return thread
+        if self._pool is not None:
+            self._pool.submit(self._install_worker, folder_path, on_output, on_complete)
+        else:
+            threading.Thread(
+                target=self._install_worker,
+                args=(folder_path, on_output, on_complete),
+                daemon=True,
+            ).start()
 
     def has_venv(self, folder_path: Path) -> bool:
         """Check if a venv exists in the folder."""
@@ -50,6 +57,81 @@ class VenvManager:
 
         return venv_python if venv_python.exists() else None
 
+    @staticmethod
+    def _pump_output(process: subprocess.Popen, on_output: Callable[[str], None]) -> None:
+        """Forward pip output promptly, splitting on both \\n and \\r.
+
+        POSIX: non-blocking os.read behind a selector, so pip's
+        carriage-return progress updates reach the UI without waiting
+        for a newline. Windows: blocking buffered line reads, since
+        select doesn't work on pipes there.
+        """
+        stdout = process.stdout
+        if sys.platform == "win32":
+            stream = io.TextIOWrapper(stdout, encoding="utf-8", errors="replace", newline="")
+            for line in stream:
+                line = line.removesuffix("\n").removesuffix("\r")
+                if line:
+                    on_output(line)
+            return
+
+        fd = stdout.fileno()
+        os.set_blocking(fd, False)
+        buf = b""
+        with selectors.DefaultSelector() as sel:
+            sel.register(fd, selectors.EVENT_READ)
+            while True:
+                if not sel.select(timeout=0.25):
+                    if process.poll() is not None:
+                        break
+                    continue
+                try:
+                    chunk = os.read(fd, 65536)
+                except BlockingIOError:
+                    continue
+                except OSError:
+                    break
+                if not chunk:
+                    break
+                buf += chunk
+                *complete, buf = buf.replace(b"\r", b"\n").split(b"\n")
+                for raw in complete:
+                    if raw:
+                        on_output(raw.decode("utf-8", errors="replace"))
+        if buf:
+            on_output(buf.decode("utf-8", errors="replace"))
+
+    def _resolve_pip_command(self, venv_python: Path, creation_flags: int) -> Optional[list[str]]:
+        """Pick the pip invocation for installing into a venv.
+
+        Preferred: the host interpreter's pip targeting the venv via
+        --python (pip >= 22.3) — works with --without-pip venvs and never
+        copies pip into them. Falls back to the venv's own pip,
+        bootstrapping it with ensurepip when missing.
+        """
+        probe = subprocess.run(
+            [self._python_path, "-m", "pip", "--python", str(venv_python), "--version"],
+            capture_output=True,
+            creationflags=creation_flags,
+        )
+        if probe.returncode == 0:
+            return [self._python_path, "-u", "-m", "pip", "--python", str(venv_python)]
+
+        check = subprocess.run(
+            [str(venv_python), "-m", "pip", "--version"],
+            capture_output=True,
+            creationflags=creation_flags,
+        )
+        if check.returncode != 0:
+            boot = subprocess.run(
+                [str(venv_python), "-m", "ensurepip", "--upgrade"],
+                capture_output=True,
+                creationflags=creation_flags,
+            )
+            if boot.returncode != 0:
+                return None
+        return [str(venv_python), "-u", "-m", "pip"]
+
     def _install_worker(
         self,
         folder_path: Path,
@@ -70,11 +152,17 @@ class VenvManager:
             creation_flags = subprocess.CREATE_NO_WINDOW
 
         try:
-            # Step 1: Create venv if it doesn't exist
+            # Step 1: Create venv if it doesn't exist. --without-pip
+            # skips the ensurepip wheel copy (~10 MB per venv); installs
+            # are driven by the host interpreter's pip instead.
             if not venv_path.exists():
                 on_output(f"Creating virtual environment in {folder_path.name}/venv...")
+                venv_args = [self._python_path, "-m", "venv", "--without-pip"]
+                if sys.platform != "win32":
+                    venv_args.append("--symlinks")
+                venv_args.append(str(venv_path))
                 result = subprocess.run(
-                    [self._python_path, "-m", "venv", str(venv_path)],
+                    venv_args,
                     capture_output=True,
                     text=True,
                     creationflags=creation_flags,
@@ -93,21 +181,38 @@ class VenvManager:
             else:
                 pip_python = venv_path / "bin" / "python"
 
+            pip_cmd = self._resolve_pip_command(pip_python, creation_flags)
+            if pip_cmd is None:
+                on_output("No usable pip found for the virtual environment.")
+                on_complete(False)
+                return
+
             on_output(f"Installing requirements from {req_file.name}...")
 
+            # --no-compile / PYTHONDONTWRITEBYTECODE skip .pyc generation
+            # (halves install I/O and leaves far fewer files to delete
+            # later); --prefer-binary avoids sdist builds where a wheel
+            # exists.
+            env = dict(os.environ)
+            env["PIP_DISABLE_PIP_VERSION_CHECK"] = "1"
+            env["PYTHONDONTWRITEBYTECODE"] = "1"
             process = subprocess.Popen(
-                [str(pip_python), "-u", "-m", "pip", "install", "-r", str(req_file)],
+                pip_cmd
+                + [
+                    "install",
+                    "--no-compile", "--prefer-binary", "--no-input",
+                    "-r", str(req_file),
+                ],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 cwd=str(folder_path),
                 creationflags=creation_flags,
+                bufsize=65536,
+                env=env,
             )
 
             if process.stdout:
-                for line_bytes in iter(process.stdout.readline, b""):
-                    decoded = line_bytes.decode("utf-8", errors="replace").rstrip()
-                    if decoded:
-                        on_output(decoded)
+                self._pump_output(process, on_output)
 
             rc = process.wait()
             if rc == 0:
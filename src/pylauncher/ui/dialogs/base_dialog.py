@@ -0,0 +1,71 @@
+"""Shared helpers for CTkToplevel dialogs."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+
+import customtkinter as ctk
+
+
+@contextmanager
+def suspend_scaling_tracker():
+    """Defer CTk ScalingTracker callback registration during bulk builds.
+
+    Every CTk widget registers a scaling callback on creation; batching
+    the registrations into one pass after construction finishes trims
+    per-widget tracker bookkeeping. The per-window DPI entry is still
+    populated eagerly — widgets read it mid-construction.
+    """
+    tracker = getattr(ctk, "ScalingTracker", None)
+    if tracker is None or "add_widget" not in tracker.__dict__:
+        yield
+        return
+
+    original = tracker.__dict__["add_widget"]
+    deferred: list[tuple] = []
+
+    def deferred_add(callback, widget):
+        window_root = tracker.get_window_root_of_widget(widget)
+        if window_root not in tracker.window_dpi_scaling_dict:
+            tracker.window_dpi_scaling_dict[window_root] = tracker.get_window_dpi_scaling(
+                window_root
+            )
+        deferred.append((callback, widget))
+
+    tracker.add_widget = deferred_add
+    try:
+        yield
+    finally:
+        tracker.add_widget = original
+        for callback, widget in deferred:
+            try:
+                tracker.add_widget(callback, widget)
+            except Exception:
+                pass  # Widget died before registration — nothing to track
+
+
+class BaseDialog(ctk.CTkToplevel):
+    """Common CTkToplevel behavior: Escape closes the dialog.
+
+    The handler is one bound method shared by every subclass instead of
+    a per-instance lambda.
+    """
+
+    def __init__(self, master: ctk.CTk, **kwargs) -> None:
+        super().__init__(master, **kwargs)
+        self.bind("<Escape>", self._on_escape)
+
+    def _on_escape(self, event) -> None:
+        self.destroy()
+
+
+def center_on(dialog: ctk.CTkToplevel, master: ctk.CTk, width: int, height: int) -> None:
+    """Size and center a dialog over its master in one geometry call.
+
+    winfo_rootx/rooty and the master's current size are valid without an
+    update_idletasks flush, so this avoids the synchronous full layout
+    pass the old geometry + update_idletasks + geometry pattern forced.
+    """
+    x = master.winfo_rootx() + (master.winfo_width() - width) // 2
+    y = master.winfo_rooty() + (master.winfo_height() - height) // 2
+    dialog.geometry(f"{width}x{height}+{x}+{y}")
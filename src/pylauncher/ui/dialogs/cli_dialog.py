@@ -2,132 +2,147 @@
 
 from __future__ import annotations
 
+import os
+import selectors
+import shlex
 import subprocess
 import sys
 import threading
+from collections import deque
 
 import customtkinter as ctk
 
 from pylauncher.constants import (
     BG_DARK,
     BG_CARD,
-    BG_INPUT,
     BG_HOVER,
     DEEP_PINK,
     DEEP_PINK_HOVER,
     TEXT_PRIMARY,
     TEXT_SECONDARY,
     BORDER_COLOR,
-    FONT_FAMILY,
-    FONT_SIZE_DEFAULT,
-    FONT_SIZE_LABEL,
-    FONT_SIZE_TITLE,
-    FONT_TITLE_FAMILY,
     INPUT_CORNER_RADIUS,
-    BUTTON_CORNER_RADIUS,
     CLI_WINDOW_WIDTH,
     CLI_WINDOW_HEIGHT,
 )
+from pylauncher.ui.dialogs.base_dialog import BaseDialog, center_on, suspend_scaling_tracker
+from pylauncher.ui.styles import (
+    CARD_STYLE,
+    ENTRY_STYLE,
+    FIELD_LABEL_STYLE,
+    FONT_DEFAULT,
+    TITLE_LABEL_STYLE,
+)
 from pylauncher.ui.widgets.output_textbox import OutputTextbox
 
 
-class CLIDialog(ctk.CTkToplevel):
+# Queued alongside output lines; tells _flush_output the command ended
+# and the execute button should come back.
+_DONE_SENTINEL = object()
+
+
+class CLIDialog(BaseDialog):
     """Command line tool with Manual and Install Package modes."""
 
+    # Precomputed configure() kwargs for the mode toggle buttons
+    _SEL = dict(fg_color=DEEP_PINK, text_color=TEXT_PRIMARY, border_width=0)
+    _UNSEL = dict(
+        fg_color=BG_CARD, text_color=TEXT_SECONDARY,
+        border_width=1, border_color=BORDER_COLOR,
+    )
+
     def __init__(self, master: ctk.CTk, python_path: str) -> None:
         super().__init__(master)
         self._python_path = python_path
         self._mode = "manual"
 
-        self.title("Command Line Tool")
-        self.geometry(f"{CLI_WINDOW_WIDTH}x{CLI_WINDOW_HEIGHT}")
-        self.resizable(False, False)
-        self.configure(fg_color=BG_DARK)
-        self.grab_set()
-
-        self.transient(master)
-        self.update_idletasks()
-        x = master.winfo_x() + (master.winfo_width() - CLI_WINDOW_WIDTH) // 2
-        y = master.winfo_y() + (master.winfo_height() - CLI_WINDOW_HEIGHT) // 2
-        self.geometry(f"+{x}+{y}")
-
-        # Escape to close
-        self.bind("<Escape>", lambda e: self.destroy())
-
-        ctk.CTkLabel(
-            self, text="Command line tool",
-            font=(FONT_TITLE_FAMILY, FONT_SIZE_TITLE), text_color=TEXT_PRIMARY,
-        ).pack(padx=25, pady=(20, 15), anchor="w")
-
-        card = ctk.CTkFrame(self, fg_color=BG_CARD, corner_radius=20)
-        card.pack(fill="both", expand=True, padx=20, pady=(0, 20))
-
-        mode_frame = ctk.CTkFrame(card, fg_color=BG_CARD)
-        mode_frame.pack(fill="x", padx=20, pady=(15, 10))
-
-        self._manual_btn = ctk.CTkButton(
-            mode_frame, text="Manual mode",
-            font=(FONT_FAMILY, FONT_SIZE_DEFAULT),
-            fg_color=DEEP_PINK, hover_color=DEEP_PINK_HOVER,
-            text_color=TEXT_PRIMARY, corner_radius=10,
-            width=140, height=34, command=self._set_manual,
-        )
-        self._manual_btn.pack(side="left", padx=(0, 10))
-
-        self._install_btn = ctk.CTkButton(
-            mode_frame, text="Install package",
-            font=(FONT_FAMILY, FONT_SIZE_DEFAULT),
-            fg_color=BG_CARD, hover_color=BG_HOVER,
-            text_color=TEXT_SECONDARY, border_color=BORDER_COLOR, border_width=1,
-            corner_radius=10, width=140, height=34, command=self._set_install,
-        )
-        self._install_btn.pack(side="left")
+        with suspend_scaling_tracker():
+            # Output lines buffer here and flush in one batch per Tk event:
+            # the reader thread schedules a single after(0) when the buffer
+            # goes non-empty instead of one callback per line.
+            self._pending_lines: deque[str] = deque()
+            self._pending_lock = threading.Lock()
+            self._flush_pending = False
+            self._current_proc: subprocess.Popen | None = None
+            self._alive = True
 
-        ctk.CTkLabel(
-            card, text="Command",
-            font=(FONT_FAMILY, FONT_SIZE_LABEL), text_color=TEXT_SECONDARY,
-        ).pack(padx=20, anchor="w")
+            self.title("Command Line Tool")
+            self.resizable(False, False)
+            self.configure(fg_color=BG_DARK)
+            self.grab_set()
 
-        cmd_frame = ctk.CTkFrame(card, fg_color=BG_CARD)
-        cmd_frame.pack(fill="x", padx=20, pady=(0, 10))
+            self.transient(master)
+            center_on(self, master, CLI_WINDOW_WIDTH, CLI_WINDOW_HEIGHT)
 
-        self._command_entry = ctk.CTkEntry(
-            cmd_frame, font=(FONT_FAMILY, FONT_SIZE_DEFAULT),
-            corner_radius=INPUT_CORNER_RADIUS,
-            border_color=BORDER_COLOR, fg_color=BG_INPUT, text_color=TEXT_PRIMARY,
-        )
-        self._command_entry.pack(side="left", fill="x", expand=True, padx=(0, 5))
-        self._command_entry.bind("<Return>", lambda e: self._execute())
-
-        self._execute_btn = ctk.CTkButton(
-            cmd_frame, text="▶", font=("Segoe UI", 14),
-            fg_color=DEEP_PINK, hover_color=DEEP_PINK_HOVER,
-            text_color=TEXT_PRIMARY, corner_radius=INPUT_CORNER_RADIUS,
-            width=40, height=30, command=self._execute,
-        )
-        self._execute_btn.pack(side="right")
+            ctk.CTkLabel(
+                self, text="Command line tool", **TITLE_LABEL_STYLE,
+            ).pack(padx=25, pady=(20, 15), anchor="w")
+
+            # One grid on the card replaces the mode_frame/cmd_frame wrapper
+            # frames — each was a full canvas-backed widget with the same
+            # background as its parent.
+            card = ctk.CTkFrame(self, **CARD_STYLE)
+            card.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+            card.grid_columnconfigure(2, weight=1)
+            card.grid_rowconfigure(4, weight=1)
 
-        ctk.CTkLabel(
-            card, text="Output",
-            font=(FONT_FAMILY, FONT_SIZE_LABEL), text_color=TEXT_SECONDARY,
-        ).pack(padx=20, anchor="w")
+            self._manual_btn = ctk.CTkButton(
+                card, text="Manual mode",
+                font=FONT_DEFAULT,
+                fg_color=DEEP_PINK, hover_color=DEEP_PINK_HOVER,
+                text_color=TEXT_PRIMARY, corner_radius=10,
+                width=140, height=34, command=lambda: self._set_mode("manual"),
+            )
+            self._manual_btn.grid(row=0, column=0, sticky="w", padx=(20, 10), pady=(15, 10))
 
-        self._output = OutputTextbox(card, corner_radius=15)
-        self._output.pack(fill="both", expand=True, padx=20, pady=(0, 15))
+            self._install_btn = ctk.CTkButton(
+                card, text="Install package",
+                font=FONT_DEFAULT,
+                fg_color=BG_CARD, hover_color=BG_HOVER,
+                text_color=TEXT_SECONDARY, border_color=BORDER_COLOR, border_width=1,
+                corner_radius=10, width=140, height=34,
+                command=lambda: self._set_mode("install"),
+            )
+            self._install_btn.grid(row=0, column=1, sticky="w", pady=(15, 10))
 
-    def _set_manual(self) -> None:
-        self._mode = "manual"
-        self._manual_btn.configure(fg_color=DEEP_PINK, text_color=TEXT_PRIMARY, border_width=0)
-        self._install_btn.configure(
-            fg_color=BG_CARD, text_color=TEXT_SECONDARY, border_width=1, border_color=BORDER_COLOR
-        )
+            ctk.CTkLabel(
+                card, text="Command", **FIELD_LABEL_STYLE,
+            ).grid(row=1, column=0, columnspan=4, sticky="w", padx=20)
+
+            self._command_entry = ctk.CTkEntry(card, **ENTRY_STYLE)
+            self._command_entry.grid(
+                row=2, column=0, columnspan=3, sticky="ew", padx=(20, 5), pady=(0, 10)
+            )
+            self._command_entry.bind("<Return>", lambda e: self._execute())
+
+            self._execute_btn = ctk.CTkButton(
+                card, text="▶", font=("Segoe UI", 14),
+                fg_color=DEEP_PINK, hover_color=DEEP_PINK_HOVER,
+                text_color=TEXT_PRIMARY, corner_radius=INPUT_CORNER_RADIUS,
+                width=40, height=30, command=self._execute,
+            )
+            self._execute_btn.grid(row=2, column=3, sticky="e", padx=(0, 20), pady=(0, 10))
+
+            ctk.CTkLabel(
+                card, text="Output", **FIELD_LABEL_STYLE,
+            ).grid(row=3, column=0, columnspan=4, sticky="w", padx=20)
 
-    def _set_install(self) -> None:
-        self._mode = "install"
-        self._install_btn.configure(fg_color=DEEP_PINK, text_color=TEXT_PRIMARY, border_width=0)
-        self._manual_btn.configure(
-            fg_color=BG_CARD, text_color=TEXT_SECONDARY, border_width=1, border_color=BORDER_COLOR
+            self._output = OutputTextbox(card, corner_radius=15, max_lines=2000)
+            self._output.grid(
+                row=4, column=0, columnspan=4, sticky="nsew", padx=20, pady=(0, 15)
+            )
+
+    def _set_mode(self, mode: str) -> None:
+        if mode == self._mode:
+            return  # no redraw for a no-op toggle
+        self._mode = mode
+        selected, unselected = (
+            (self._manual_btn, self._install_btn)
+            if mode == "manual"
+            else (self._install_btn, self._manual_btn)
         )
+        selected.configure(**self._SEL)
+        unselected.configure(**self._UNSEL)
 
     def _execute(self) -> None:
         cmd_text = self._command_entry.get().strip()
@@ -135,32 +150,145 @@ class CLIDialog(ctk.CTkToplevel):
             if not self._python_path:
                 self._output.append_line("Error: Python path not set.")
             return
+
+        # Build an argv list and skip shell=True — no cmd.exe/sh wrapper
+        # process per command, and arguments are quoted safely.
+        try:
+            extra = shlex.split(cmd_text, posix=(sys.platform != "win32"))
+        except ValueError as e:
+            self._output.append_line(f"Error: {e}")
+            return
         if self._mode == "manual":
-            command = f"{self._python_path} {cmd_text}"
+            argv = [self._python_path, *extra]
         else:
-            command = f"{self._python_path} -m pip install {cmd_text}"
-        self._output.append_line(f"> {command}")
+            argv = [self._python_path, "-m", "pip", "install", *extra]
+
+        self._output.append_line(f"> {subprocess.list2cmdline(argv)}")
         self._execute_btn.configure(state="disabled")
-        thread = threading.Thread(target=self._run_command, args=(command,), daemon=True)
+        thread = threading.Thread(target=self._run_command, args=(argv,), daemon=True)
         thread.start()
 
-    def _run_command(self, command: str) -> None:
+    def destroy(self) -> None:
+        """Stop any in-flight command before tearing the dialog down."""
+        self._alive = False
+        proc = self._current_proc
+        if proc is not None and proc.poll() is None:
+            try:
+                proc.terminate()
+                if proc.stdout:
+                    proc.stdout.close()
+            except OSError:
+                pass
+        super().destroy()
+
+    def _queue_line(self, line: "str | object") -> None:
+        """Reader-thread side: buffer a line or sentinel, scheduling one flush."""
+        if not self._alive:
+            return
+        with self._pending_lock:
+            self._pending_lines.append(line)
+            if self._flush_pending:
+                return
+            self._flush_pending = True
+        try:
+            # after_idle lets Tk coalesce redraws between event ticks
+            self.after_idle(self._flush_output)
+        except Exception:
+            pass  # Dialog destroyed between the alive check and here
+
+    def _flush_output(self) -> None:
+        """Main-thread side: drain the buffer with a single widget insert."""
+        if not self._alive:
+            return
+        with self._pending_lock:
+            items = list(self._pending_lines)
+            self._pending_lines.clear()
+            self._flush_pending = False
+
+        done = False
+        lines = []
+        for item in items:
+            if item is _DONE_SENTINEL:
+                done = True
+            else:
+                lines.append(item)
+        if lines:
+            self._output.append_lines(lines)
+        if done:
+            self._execute_btn.configure(state="normal")
+
+    def _pump_stdout(self, process: subprocess.Popen) -> None:
+        """Read large chunks off the raw fd and queue complete lines —
+        one decode covers many lines instead of a readline per line.
+        """
+        residual = bytearray()
+        for chunk in self._iter_chunks(process):
+            if not self._alive:
+                return
+            residual += chunk
+            cut = residual.rfind(b"\n")
+            if cut < 0:
+                continue
+            text = residual[: cut + 1].decode("utf-8", errors="replace")
+            del residual[: cut + 1]
+            for line in text.split("\n"):
+                line = line.removesuffix("\r")
+                if line:
+                    self._queue_line(line)
+        if residual:
+            tail = residual.decode("utf-8", errors="replace").removesuffix("\r")
+            if tail:
+                self._queue_line(tail)
+
+    @staticmethod
+    def _iter_chunks(process: subprocess.Popen):
+        """Yield raw stdout chunks as they arrive.
+
+        POSIX sleeps on a selector until bytes are ready; Windows keeps
+        blocking reads since select doesn't work on pipes there.
+        """
+        fd = process.stdout.fileno()
+        if sys.platform == "win32":
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    return
+                yield chunk
+
+        os.set_blocking(fd, False)
+        with selectors.DefaultSelector() as sel:
+            sel.register(fd, selectors.EVENT_READ)
+            while True:
+                if not sel.select(timeout=0.5):
+                    if process.poll() is not None:
+                        return
+                    continue
+                try:
+                    chunk = os.read(fd, 65536)
+                except BlockingIOError:
+                    continue
+                except OSError:
+                    return
+                if not chunk:
+                    return
+                yield chunk
+
+    def _run_command(self, argv: list[str]) -> None:
         creation_flags = 0
         if sys.platform == "win32":
             creation_flags = subprocess.CREATE_NO_WINDOW
         try:
             process = subprocess.Popen(
-                command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-                shell=True, creationflags=creation_flags,
+                argv, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                creationflags=creation_flags, bufsize=0,
             )
+            self._current_proc = process
             if process.stdout:
-                for line_bytes in iter(process.stdout.readline, b""):
-                    decoded = line_bytes.decode("utf-8", errors="replace").rstrip()
-                    if decoded:
-                        self.after(0, lambda t=decoded: self._output.append_line(t))
+                self._pump_stdout(process)
             process.wait()
-            self.after(0, lambda: self._output.append_line("--- Done ---"))
+            self._queue_line("--- Done ---")
         except Exception as e:
-            self.after(0, lambda: self._output.append_line(f"Error: {e}"))
+            self._queue_line(f"Error: {e}")
         finally:
-            self.after(0, lambda: self._execute_btn.configure(state="normal"))
+            self._current_proc = None
+            self._queue_line(_DONE_SENTINEL)
@@ -2,28 +2,31 @@
 
 from __future__ import annotations
 
+import re
 from tkinter import messagebox
 
 import customtkinter as ctk
 
+from pylauncher.ui.dialogs.base_dialog import BaseDialog, center_on, suspend_scaling_tracker
+from pylauncher.ui.styles import (
+    CARD_STYLE,
+    ENTRY_STYLE,
+    FIELD_LABEL_STYLE,
+    OPTION_MENU_STYLE,
+    PRIMARY_BTN,
+    SECONDARY_BTN,
+    TITLE_LABEL_STYLE,
+)
 from pylauncher.constants import (
     BG_DARK,
     BG_CARD,
-    BG_INPUT,
-    BG_HOVER,
     DEEP_PINK,
     DEEP_PINK_HOVER,
     TEXT_PRIMARY,
-    TEXT_SECONDARY,
     BORDER_COLOR,
     FONT_FAMILY,
     FONT_SIZE_DEFAULT,
     FONT_SIZE_SMALL,
-    FONT_SIZE_LABEL,
-    FONT_SIZE_TITLE,
-    FONT_TITLE_FAMILY,
-    BUTTON_CORNER_RADIUS,
-    INPUT_CORNER_RADIUS,
     SCHEDULE_DIALOG_WIDTH,
     SCHEDULE_DIALOG_HEIGHT,
 )
@@ -31,9 +34,21 @@ from pylauncher.constants import (
 _TYPE_OPTIONS = ["Off", "Daily", "Interval", "Weekdays"]
 _UNIT_OPTIONS = ["Minutes", "Hours"]
 _DAY_NAMES = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+_DAY_INDEX = {day.lower(): i for i, day in enumerate(_DAY_NAMES)}
+
+# One compiled match classifies the stored schedule string instead of a
+# split/lower/strip branch ladder; anything that doesn't match loads as
+# Off. Whitespace around the | separators is tolerated like the core
+# parser (hand-edited me.ini files such as "daily | 09:00").
+_LOAD_RE = re.compile(
+    r"^(?:daily\s*\|\s*(?P<daily>\d{1,2}:\d{1,2})\s*"
+    r"|interval\s*\|\s*(?P<num>\d+)\s*(?P<unit>[mh]?)\s*"
+    r"|weekdays\s*\|\s*(?P<wtime>\d{1,2}:\d{1,2})\s*\|\s*(?P<days>[a-z, ]+))$",
+    re.I,
+)
 
 
-class ScheduleDialog(ctk.CTkToplevel):
+class ScheduleDialog(BaseDialog):
     """Configure schedule for a single script."""
 
     def __init__(
@@ -46,191 +61,170 @@ class ScheduleDialog(ctk.CTkToplevel):
         super().__init__(master)
         self._on_save = on_save
 
-        self.title("Schedule")
-        self.geometry(f"{SCHEDULE_DIALOG_WIDTH}x{SCHEDULE_DIALOG_HEIGHT}")
-        self.resizable(False, False)
-        self.configure(fg_color=BG_DARK)
-        self.grab_set()
-
-        self.transient(master)
-        self.update_idletasks()
-        x = master.winfo_x() + (master.winfo_width() - SCHEDULE_DIALOG_WIDTH) // 2
-        y = master.winfo_y() + (master.winfo_height() - SCHEDULE_DIALOG_HEIGHT) // 2
-        self.geometry(f"+{x}+{y}")
-
-        self.bind("<Escape>", lambda e: self.destroy())
+        with suspend_scaling_tracker():
+            self.title("Schedule")
+            self.resizable(False, False)
+            self.configure(fg_color=BG_DARK)
+            self.grab_set()
+
+            self.transient(master)
+            center_on(self, master, SCHEDULE_DIALOG_WIDTH, SCHEDULE_DIALOG_HEIGHT)
+
+            ctk.CTkLabel(
+                self, text=f"Schedule: {script_name}", **TITLE_LABEL_STYLE,
+            ).pack(padx=25, pady=(20, 15), anchor="w")
+
+            card = ctk.CTkFrame(self, **CARD_STYLE)
+            card.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+
+            # Type selector
+            type_frame = ctk.CTkFrame(card, fg_color=BG_CARD)
+            type_frame.pack(fill="x", padx=20, pady=(15, 10))
+
+            ctk.CTkLabel(
+                type_frame, text="Type", **FIELD_LABEL_STYLE,
+            ).pack(side="left", padx=(0, 10))
+
+            self._type_var = ctk.StringVar(value="Off")
+            self._type_menu = ctk.CTkOptionMenu(
+                type_frame, values=_TYPE_OPTIONS, variable=self._type_var,
+                width=160, height=35, command=self._on_type_changed,
+                **OPTION_MENU_STYLE,
+            )
+            self._type_menu.pack(side="left")
+
+            # Type-specific frames are built lazily on first show — each CTk
+            # widget is canvas-backed and costly, and "Off" (no frames) is
+            # the common case on open.
+            self._card = card
+            self._time_frame: ctk.CTkFrame | None = None
+            self._interval_frame: ctk.CTkFrame | None = None
+            self._weekdays_frame: ctk.CTkFrame | None = None
+            # Selected days as one int bitmask (bit i = _DAY_NAMES[i]) —
+            # no per-day BooleanVar round-trips through Tcl.
+            self._day_bits = 0
+            self._day_checks: list[ctk.CTkCheckBox] = []
+
+            # Buttons
+            btn_frame = ctk.CTkFrame(card, fg_color=BG_CARD)
+            btn_frame.pack(fill="x", padx=20, pady=(15, 20), side="bottom")
+
+            ctk.CTkButton(
+                btn_frame, text="Save", width=100, height=38,
+                command=self._save, **PRIMARY_BTN,
+            ).pack(side="right", padx=(5, 0))
+
+            ctk.CTkButton(
+                btn_frame, text="Cancel", width=100, height=38,
+                command=self.destroy, **SECONDARY_BTN,
+            ).pack(side="right")
+
+            # Load current schedule
+            self._load_schedule(current_schedule)
+
+    # ── Lazy frame builders ──
+
+    def _ensure_time_frame(self) -> ctk.CTkFrame:
+        if self._time_frame is not None:
+            return self._time_frame
+        # Widgets grid straight into the frame — no same-color row
+        # wrapper frame in between.
+        self._time_frame = ctk.CTkFrame(self._card, fg_color=BG_CARD)
 
         ctk.CTkLabel(
-            self, text=f"Schedule: {script_name}",
-            font=(FONT_TITLE_FAMILY, FONT_SIZE_TITLE), text_color=TEXT_PRIMARY,
-        ).pack(padx=25, pady=(20, 15), anchor="w")
-
-        card = ctk.CTkFrame(self, fg_color=BG_CARD, corner_radius=20)
-        card.pack(fill="both", expand=True, padx=20, pady=(0, 20))
-
-        # Type selector
-        type_frame = ctk.CTkFrame(card, fg_color=BG_CARD)
-        type_frame.pack(fill="x", padx=20, pady=(15, 10))
-
-        ctk.CTkLabel(
-            type_frame, text="Type",
-            font=(FONT_FAMILY, FONT_SIZE_LABEL), text_color=TEXT_SECONDARY,
-        ).pack(side="left", padx=(0, 10))
-
-        self._type_var = ctk.StringVar(value="Off")
-        self._type_menu = ctk.CTkOptionMenu(
-            type_frame, values=_TYPE_OPTIONS, variable=self._type_var,
-            font=(FONT_FAMILY, FONT_SIZE_DEFAULT),
-            fg_color=BG_INPUT, button_color=BG_HOVER, button_hover_color=DEEP_PINK,
-            text_color=TEXT_PRIMARY, dropdown_fg_color=BG_INPUT,
-            dropdown_text_color=TEXT_PRIMARY, dropdown_hover_color=DEEP_PINK,
-            width=160, height=35, command=self._on_type_changed,
-        )
-        self._type_menu.pack(side="left")
-
-        # Daily / Weekdays time frame
-        self._time_frame = ctk.CTkFrame(card, fg_color=BG_CARD)
-
-        ctk.CTkLabel(
-            self._time_frame, text="Time (HH:MM)",
-            font=(FONT_FAMILY, FONT_SIZE_LABEL), text_color=TEXT_SECONDARY,
-        ).pack(anchor="w", padx=20)
-
-        time_row = ctk.CTkFrame(self._time_frame, fg_color=BG_CARD)
-        time_row.pack(fill="x", padx=20, pady=(5, 0))
+            self._time_frame, text="Time (HH:MM)", **FIELD_LABEL_STYLE,
+        ).grid(row=0, column=0, columnspan=3, sticky="w", padx=20)
 
         self._hour_entry = ctk.CTkEntry(
-            time_row, width=60, height=35,
-            font=(FONT_FAMILY, FONT_SIZE_DEFAULT),
-            fg_color=BG_INPUT, text_color=TEXT_PRIMARY,
-            border_color=BORDER_COLOR, corner_radius=INPUT_CORNER_RADIUS,
-            placeholder_text="09",
+            self._time_frame, width=60, height=35, placeholder_text="09", **ENTRY_STYLE,
         )
-        self._hour_entry.pack(side="left")
+        self._hour_entry.grid(row=1, column=0, sticky="w", padx=(20, 0), pady=(5, 0))
 
         ctk.CTkLabel(
-            time_row, text=" : ",
+            self._time_frame, text=" : ",
             font=(FONT_FAMILY, FONT_SIZE_DEFAULT), text_color=TEXT_PRIMARY,
-        ).pack(side="left")
+        ).grid(row=1, column=1, pady=(5, 0))
 
         self._minute_entry = ctk.CTkEntry(
-            time_row, width=60, height=35,
-            font=(FONT_FAMILY, FONT_SIZE_DEFAULT),
-            fg_color=BG_INPUT, text_color=TEXT_PRIMARY,
-            border_color=BORDER_COLOR, corner_radius=INPUT_CORNER_RADIUS,
-            placeholder_text="30",
+            self._time_frame, width=60, height=35, placeholder_text="30", **ENTRY_STYLE,
         )
-        self._minute_entry.pack(side="left")
+        self._minute_entry.grid(row=1, column=2, sticky="w", pady=(5, 0))
+        return self._time_frame
 
-        # Interval frame
-        self._interval_frame = ctk.CTkFrame(card, fg_color=BG_CARD)
+    def _ensure_interval_frame(self) -> ctk.CTkFrame:
+        if self._interval_frame is not None:
+            return self._interval_frame
+        self._interval_frame = ctk.CTkFrame(self._card, fg_color=BG_CARD)
 
         ctk.CTkLabel(
-            self._interval_frame, text="Run every",
-            font=(FONT_FAMILY, FONT_SIZE_LABEL), text_color=TEXT_SECONDARY,
-        ).pack(anchor="w", padx=20)
-
-        interval_row = ctk.CTkFrame(self._interval_frame, fg_color=BG_CARD)
-        interval_row.pack(fill="x", padx=20, pady=(5, 0))
+            self._interval_frame, text="Run every", **FIELD_LABEL_STYLE,
+        ).grid(row=0, column=0, columnspan=2, sticky="w", padx=20)
 
         self._interval_entry = ctk.CTkEntry(
-            interval_row, width=80, height=35,
-            font=(FONT_FAMILY, FONT_SIZE_DEFAULT),
-            fg_color=BG_INPUT, text_color=TEXT_PRIMARY,
-            border_color=BORDER_COLOR, corner_radius=INPUT_CORNER_RADIUS,
-            placeholder_text="30",
+            self._interval_frame, width=80, height=35, placeholder_text="30", **ENTRY_STYLE,
         )
-        self._interval_entry.pack(side="left", padx=(0, 10))
+        self._interval_entry.grid(row=1, column=0, sticky="w", padx=(20, 10), pady=(5, 0))
 
         self._unit_var = ctk.StringVar(value="Minutes")
         ctk.CTkOptionMenu(
-            interval_row, values=_UNIT_OPTIONS, variable=self._unit_var,
-            font=(FONT_FAMILY, FONT_SIZE_DEFAULT),
-            fg_color=BG_INPUT, button_color=BG_HOVER, button_hover_color=DEEP_PINK,
-            text_color=TEXT_PRIMARY, dropdown_fg_color=BG_INPUT,
-            dropdown_text_color=TEXT_PRIMARY, dropdown_hover_color=DEEP_PINK,
-            width=120, height=35,
-        ).pack(side="left")
+            self._interval_frame, values=_UNIT_OPTIONS, variable=self._unit_var,
+            width=120, height=35, **OPTION_MENU_STYLE,
+        ).grid(row=1, column=1, sticky="w", pady=(5, 0))
+        return self._interval_frame
 
-        # Weekdays frame
-        self._weekdays_frame = ctk.CTkFrame(card, fg_color=BG_CARD)
+    def _ensure_weekdays_frame(self) -> ctk.CTkFrame:
+        if self._weekdays_frame is not None:
+            return self._weekdays_frame
+        self._weekdays_frame = ctk.CTkFrame(self._card, fg_color=BG_CARD)
 
         ctk.CTkLabel(
-            self._weekdays_frame, text="Days",
-            font=(FONT_FAMILY, FONT_SIZE_LABEL), text_color=TEXT_SECONDARY,
-        ).pack(anchor="w", padx=20)
-
-        days_row = ctk.CTkFrame(self._weekdays_frame, fg_color=BG_CARD)
-        days_row.pack(fill="x", padx=20, pady=(5, 0))
-
-        self._day_vars: dict[str, ctk.BooleanVar] = {}
-        for day in _DAY_NAMES:
-            var = ctk.BooleanVar(value=False)
-            self._day_vars[day.lower()] = var
-            ctk.CTkCheckBox(
-                days_row, text=day, variable=var,
+            self._weekdays_frame, text="Days", **FIELD_LABEL_STYLE,
+        ).grid(row=0, column=0, columnspan=len(_DAY_NAMES), sticky="w", padx=20)
+
+        for i, day in enumerate(_DAY_NAMES):
+            check = ctk.CTkCheckBox(
+                self._weekdays_frame, text=day,
                 font=(FONT_FAMILY, FONT_SIZE_SMALL),
                 fg_color=DEEP_PINK, hover_color=DEEP_PINK_HOVER,
                 border_color=BORDER_COLOR, text_color=TEXT_PRIMARY,
                 checkbox_width=18, checkbox_height=18, width=55,
-            ).pack(side="left", padx=1)
-
-        # Buttons
-        btn_frame = ctk.CTkFrame(card, fg_color=BG_CARD)
-        btn_frame.pack(fill="x", padx=20, pady=(15, 20), side="bottom")
-
-        ctk.CTkButton(
-            btn_frame, text="Save",
-            font=(FONT_FAMILY, FONT_SIZE_DEFAULT),
-            fg_color=DEEP_PINK, hover_color=DEEP_PINK_HOVER,
-            text_color=TEXT_PRIMARY, corner_radius=BUTTON_CORNER_RADIUS,
-            width=100, height=38, command=self._save,
-        ).pack(side="right", padx=(5, 0))
-
-        ctk.CTkButton(
-            btn_frame, text="Cancel",
-            font=(FONT_FAMILY, FONT_SIZE_DEFAULT),
-            fg_color=BG_HOVER, hover_color=BG_INPUT,
-            text_color=TEXT_PRIMARY, corner_radius=BUTTON_CORNER_RADIUS,
-            width=100, height=38, command=self.destroy,
-        ).pack(side="right")
-
-        # Load current schedule
-        self._load_schedule(current_schedule)
+                command=lambda i=i: self._toggle_day(i),
+            )
+            check.grid(row=1, column=i, padx=(20, 1) if i == 0 else 1, pady=(5, 0))
+            self._day_checks.append(check)
+        return self._weekdays_frame
+
+    def _toggle_day(self, index: int) -> None:
+        self._day_bits ^= 1 << index
 
     def _load_schedule(self, raw: str) -> None:
         """Parse and populate the form from a schedule string."""
-        if not raw or raw.lower() == "off":
+        match = _LOAD_RE.match(raw.strip()) if raw else None
+        if match is None:
             self._type_var.set("Off")
             self._on_type_changed("Off")
             return
 
-        parts = raw.split("|")
-        stype = parts[0].lower().strip()
-
-        if stype == "daily" and len(parts) >= 2:
+        if match.group("daily"):
             self._type_var.set("Daily")
-            self._set_time(parts[1])
-        elif stype == "interval" and len(parts) >= 2:
+            self._ensure_time_frame()
+            self._set_time(match.group("daily"))
+        elif match.group("num"):
             self._type_var.set("Interval")
-            val = parts[1].strip().lower()
-            if val.endswith("h"):
-                self._interval_entry.insert(0, val[:-1])
+            self._ensure_interval_frame()
+            self._interval_entry.insert(0, match.group("num"))
+            if match.group("unit").lower() == "h":
                 self._unit_var.set("Hours")
-            elif val.endswith("m"):
-                self._interval_entry.insert(0, val[:-1])
-                self._unit_var.set("Minutes")
-            else:
-                self._interval_entry.insert(0, val)
-        elif stype == "weekdays" and len(parts) >= 3:
-            self._type_var.set("Weekdays")
-            self._set_time(parts[1])
-            for day_str in parts[2].lower().split(","):
-                day_str = day_str.strip()
-                if day_str in self._day_vars:
-                    self._day_vars[day_str].set(True)
         else:
-            self._type_var.set("Off")
+            self._type_var.set("Weekdays")
+            self._ensure_time_frame()
+            self._ensure_weekdays_frame()
+            self._set_time(match.group("wtime"))
+            for day_str in match.group("days").lower().split(","):
+                index = _DAY_INDEX.get(day_str.strip())
+                if index is not None:
+                    self._day_bits |= 1 << index
+                    self._day_checks[index].select()
 
         self._on_type_changed(self._type_var.get())
 
@@ -243,17 +237,17 @@ class ScheduleDialog(ctk.CTkToplevel):
             pass
 
     def _on_type_changed(self, value: str) -> None:
-        self._time_frame.pack_forget()
-        self._interval_frame.pack_forget()
-        self._weekdays_frame.pack_forget()
+        for frame in (self._time_frame, self._interval_frame, self._weekdays_frame):
+            if frame is not None:
+                frame.pack_forget()
 
         if value == "Daily":
-            self._time_frame.pack(fill="x", pady=(5, 0))
+            self._ensure_time_frame().pack(fill="x", pady=(5, 0))
         elif value == "Interval":
-            self._interval_frame.pack(fill="x", pady=(5, 0))
+            self._ensure_interval_frame().pack(fill="x", pady=(5, 0))
         elif value == "Weekdays":
-            self._time_frame.pack(fill="x", pady=(5, 0))
-            self._weekdays_frame.pack(fill="x", pady=(5, 0))
+            self._ensure_time_frame().pack(fill="x", pady=(5, 0))
+            self._ensure_weekdays_frame().pack(fill="x", pady=(5, 0))
 
     def _save(self) -> None:
         schedule = self._build_schedule_string()
@@ -278,7 +272,7 @@ class ScheduleDialog(ctk.CTkToplevel):
 
         elif stype == "Interval":
             val = self._interval_entry.get().strip()
-            if not val or not val.isdigit() or int(val) <= 0:
+            if not val.isdigit() or int(val) == 0:
                 messagebox.showwarning("Invalid", "Enter a positive number.", parent=self)
                 return None
             unit = "m" if self._unit_var.get() == "Minutes" else "h"
@@ -299,19 +293,18 @@ class ScheduleDialog(ctk.CTkToplevel):
         if not h or not m:
             messagebox.showwarning("Invalid", "Enter hour and minute.", parent=self)
             return None
-        try:
-            hour = int(h)
-            minute = int(m)
-            if not (0 <= hour <= 23 and 0 <= minute <= 59):
-                raise ValueError
-        except ValueError:
+        # isdigit rules out signs and junk, so no try/except on the
+        # normal flow; only the upper bounds need checking.
+        if not (h.isdigit() and m.isdigit()):
+            messagebox.showwarning("Invalid", "Time must be HH:MM (00-23:00-59).", parent=self)
+            return None
+        hour, minute = int(h), int(m)
+        if hour > 23 or minute > 59:
             messagebox.showwarning("Invalid", "Time must be HH:MM (00-23:00-59).", parent=self)
             return None
         return f"{hour:02d}:{minute:02d}"
 
     def _get_selected_days(self) -> str:
-        selected = []
-        for day in _DAY_NAMES:
-            if self._day_vars[day.lower()].get():
-                selected.append(day.lower())
-        return ",".join(selected)
+        return ",".join(
+            _DAY_NAMES[i].lower() for i in range(len(_DAY_NAMES)) if self._day_bits >> i & 1
+        )
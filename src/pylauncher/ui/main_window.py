@@ -16,6 +16,7 @@ from pylauncher.constants import (
     TEXT_SECONDARY,
     CARD_CORNER_RADIUS,
 )
+from pylauncher.ui.dialogs.base_dialog import suspend_scaling_tracker
 from pylauncher.ui.tabs.installed_tab import InstalledTab
 from pylauncher.ui.tabs.running_tab import RunningTab
 from pylauncher.ui.tabs.logs_tab import LogsTab
@@ -31,33 +32,61 @@ class MainWindow(ctk.CTkFrame):
         super().__init__(master, fg_color=BG_DARK)
         self._app = app
 
-        card = ctk.CTkFrame(self, fg_color=BG_CARD, corner_radius=CARD_CORNER_RADIUS)
-        card.pack(fill="both", expand=True, padx=20, pady=(10, 20))
+        with suspend_scaling_tracker():
+            card = ctk.CTkFrame(self, fg_color=BG_CARD, corner_radius=CARD_CORNER_RADIUS)
+            card.pack(fill="both", expand=True, padx=20, pady=(10, 20))
 
-        self._tabview = ctk.CTkTabview(
-            card, fg_color=BG_CARD,
-            segmented_button_fg_color=BG_SURFACE,
-            segmented_button_selected_color=DEEP_PINK,
-            segmented_button_selected_hover_color=DEEP_PINK_HOVER,
-            segmented_button_unselected_color=BG_SURFACE,
-            segmented_button_unselected_hover_color=BG_HOVER,
-            text_color=TEXT_SECONDARY, corner_radius=15,
-        )
-        self._tabview.pack(fill="both", expand=True, padx=10, pady=10)
+            self._tabview = ctk.CTkTabview(
+                card, fg_color=BG_CARD,
+                segmented_button_fg_color=BG_SURFACE,
+                segmented_button_selected_color=DEEP_PINK,
+                segmented_button_selected_hover_color=DEEP_PINK_HOVER,
+                segmented_button_unselected_color=BG_SURFACE,
+                segmented_button_unselected_hover_color=BG_HOVER,
+                text_color=TEXT_SECONDARY, corner_radius=15,
+                command=self._on_tab_selected,
+            )
+            self._tabview.pack(fill="both", expand=True, padx=10, pady=10)
 
-        self._tabview.add("Installed")
-        self._tabview.add("Running")
-        self._tabview.add("Logs")
+            self._tabview.add("Installed")
+            self._tabview.add("Running")
+            self._tabview.add("Logs")
 
-        self.installed_tab = InstalledTab(self._tabview.tab("Installed"), app)
-        self.installed_tab.pack(fill="both", expand=True)
+            # Only the default tab is built eagerly; Running and Logs bodies
+            # are constructed on first selection or first programmatic use —
+            # CTk widgets are canvas-backed and dominate first-paint cost.
+            self.installed_tab = InstalledTab(self._tabview.tab("Installed"), app)
+            self.installed_tab.pack(fill="both", expand=True)
 
-        self.running_tab = RunningTab(self._tabview.tab("Running"), app)
-        self.running_tab.pack(fill="both", expand=True)
+            self._running_tab: RunningTab | None = None
+            self._logs_tab: LogsTab | None = None
 
-        self.logs_tab = LogsTab(self._tabview.tab("Logs"))
-        self.logs_tab.pack(fill="both", expand=True)
+    @property
+    def running_tab(self) -> RunningTab:
+        if self._running_tab is None:
+            self._running_tab = RunningTab(self._tabview.tab("Running"), self._app)
+            self._running_tab.pack(fill="both", expand=True)
+        return self._running_tab
+
+    @property
+    def logs_tab(self) -> LogsTab:
+        if self._logs_tab is None:
+            self._logs_tab = LogsTab(self._tabview.tab("Logs"))
+            self._logs_tab.pack(fill="both", expand=True)
+        return self._logs_tab
+
+    def _on_tab_selected(self) -> None:
+        """Build a lazily-created tab body the first time it's shown."""
+        name = self._tabview.get()
+        if name == "Running":
+            _ = self.running_tab
+        elif name == "Logs":
+            _ = self.logs_tab
 
     def set_tab(self, name: str) -> None:
         """Programmatically switch to a named tab."""
+        if name == "Running":
+            _ = self.running_tab
+        elif name == "Logs":
+            _ = self.logs_tab
         self._tabview.set(name)
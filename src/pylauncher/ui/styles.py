@@ -0,0 +1,73 @@
+"""Shared font tuples and widget style presets for dialog construction.
+
+Each preset is a keyword dict unpacked into a CTk constructor, so
+repeated widget flavours share one tuple/dict instead of rebuilding the
+same kwargs on every dialog open.
+"""
+
+from __future__ import annotations
+
+from pylauncher.constants import (
+    BG_CARD,
+    BG_HOVER,
+    BG_INPUT,
+    BORDER_COLOR,
+    BUTTON_CORNER_RADIUS,
+    DEEP_PINK,
+    DEEP_PINK_HOVER,
+    FONT_FAMILY,
+    FONT_SIZE_DEFAULT,
+    FONT_SIZE_LABEL,
+    FONT_SIZE_SMALL,
+    FONT_SIZE_TITLE,
+    FONT_TITLE_FAMILY,
+    INPUT_CORNER_RADIUS,
+    TEXT_PRIMARY,
+    TEXT_SECONDARY,
+)
+
+FONT_DEFAULT = (FONT_FAMILY, FONT_SIZE_DEFAULT)
+FONT_LABEL = (FONT_FAMILY, FONT_SIZE_LABEL)
+FONT_SMALL = (FONT_FAMILY, FONT_SIZE_SMALL)
+FONT_TITLE = (FONT_TITLE_FAMILY, FONT_SIZE_TITLE)
+
+PRIMARY_BTN = dict(
+    font=FONT_DEFAULT,
+    fg_color=DEEP_PINK,
+    hover_color=DEEP_PINK_HOVER,
+    text_color=TEXT_PRIMARY,
+    corner_radius=BUTTON_CORNER_RADIUS,
+)
+
+SECONDARY_BTN = dict(
+    font=FONT_DEFAULT,
+    fg_color=BG_HOVER,
+    hover_color=BG_INPUT,
+    text_color=TEXT_PRIMARY,
+    corner_radius=BUTTON_CORNER_RADIUS,
+)
+
+ENTRY_STYLE = dict(
+    font=FONT_DEFAULT,
+    fg_color=BG_INPUT,
+    text_color=TEXT_PRIMARY,
+    border_color=BORDER_COLOR,
+    corner_radius=INPUT_CORNER_RADIUS,
+)
+
+OPTION_MENU_STYLE = dict(
+    font=FONT_DEFAULT,
+    fg_color=BG_INPUT,
+    button_color=BG_HOVER,
+    button_hover_color=DEEP_PINK,
+    text_color=TEXT_PRIMARY,
+    dropdown_fg_color=BG_INPUT,
+    dropdown_text_color=TEXT_PRIMARY,
+    dropdown_hover_color=DEEP_PINK,
+)
+
+CARD_STYLE = dict(fg_color=BG_CARD, corner_radius=20)
+
+TITLE_LABEL_STYLE = dict(font=FONT_TITLE, text_color=TEXT_PRIMARY)
+
+FIELD_LABEL_STYLE = dict(font=FONT_LABEL, text_color=TEXT_SECONDARY)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING
 
 import customtkinter as ctk
@@ -28,11 +29,20 @@ from pylauncher.constants import (
 )
 from pylauncher.core.script_manager import ScriptInfo
 from pylauncher.ui.widgets.script_row import ScriptRow
+from pylauncher.utils.assets import IconSet, build_default_iconset
 
 if TYPE_CHECKING:
     from pylauncher.app import PyLauncherApp
 
 
+def _char_mask(s: str) -> int:
+    """64-bit character-presence fingerprint (Bloom-style prefilter)."""
+    mask = 0
+    for ch in s:
+        mask |= 1 << (ord(ch) & 63)
+    return mask
+
+
 class InstalledTab(ctk.CTkFrame):
     """Installed scripts list with search, tag filter, bulk actions, and Import."""
 
@@ -42,6 +52,24 @@ class InstalledTab(ctk.CTkFrame):
         self._rows: dict[str, ScriptRow] = {}
         self._script_order: list[str] = []
         self._active_tag: str | None = None
+        # Rows are built in batches on the event loop so a large scripts
+        # directory doesn't freeze the UI during a refresh.
+        self._build_queue: list[ScriptInfo] = []
+        self._build_after_id: str | None = None
+        # Lowercased "name\x00key" haystack per row, so each keystroke
+        # does one substring test instead of re-lowercasing every name.
+        self._search_index: dict[str, str] = {}
+        # Character-presence masks over the haystacks: most rows are
+        # rejected with one int AND before the substring test runs.
+        self._char_masks: dict[str, int] = {}
+        # Tag membership as frozensets for O(1) chip filtering
+        self._tag_sets: dict[str, frozenset[str]] = {}
+        # Checked rows maintained incrementally — no full scans on toggle
+        self._checked_keys: set[str] = set()
+        self._last_tag_set: frozenset[str] | None = None
+        self._filter_after_id: str | None = None
+        # One batch-loaded icon set shared by every row
+        self._icon_set: IconSet | None = None
 
         # ── Row 1: Header with search, bulk actions, import ──
         header = ctk.CTkFrame(self, fg_color=BG_CARD)
@@ -66,7 +94,7 @@ class InstalledTab(ctk.CTkFrame):
             width=200, height=35,
         )
         self._search_entry.pack(side="left", padx=(0, 10))
-        self._search_entry.bind("<KeyRelease>", self._apply_filters)
+        self._search_entry.bind("<KeyRelease>", self._schedule_filter)
 
         # Import button (rightmost)
         self._import_btn = ctk.CTkButton(
@@ -113,15 +141,32 @@ class InstalledTab(ctk.CTkFrame):
             font=(FONT_FAMILY, FONT_SIZE_SMALL), text_color=TEXT_DIM,
         )
 
-    def refresh_scripts(self) -> None:
-        """Re-scan scripts dir and rebuild all rows."""
-        for widget in self._scroll_frame.winfo_children():
-            if widget != self._empty_label:
-                widget.destroy()
-        self._rows.clear()
-        self._script_order.clear()
+    ROW_BUILD_BATCH = 30  # rows constructed per event-loop slice
+    # Shared pack options for script rows — one dict reused by the
+    # build and filter loops instead of a fresh literal per call.
+    _ROW_PACK = {"fill": "x", "padx": 5, "pady": 3}
+
+    def refresh_scripts(self, scripts: list[ScriptInfo] | None = None) -> None:
+        """Rebuild all rows, re-scanning scripts dir unless given a list."""
+        if self._build_after_id is not None:
+            self.after_cancel(self._build_after_id)
+            self._build_after_id = None
+        self._build_queue.clear()
 
-        scripts = self._app.script_manager.discover_all()
+        if scripts is None:
+            scripts = self._app.script_manager.discover_all()
+
+        # Keep rows whose folders still exist and reconfigure them in
+        # place; only the set difference is destroyed or created.
+        new_keys = {s.folder_path.name for s in scripts}
+        for key in self._rows.keys() - new_keys:
+            self._rows.pop(key).destroy()
+
+        self._script_order.clear()
+        self._search_index.clear()
+        self._char_masks.clear()
+        self._tag_sets.clear()
+        self._checked_keys.clear()
 
         if not scripts:
             self._empty_label.pack(pady=100)
@@ -131,7 +176,33 @@ class InstalledTab(ctk.CTkFrame):
         self._empty_label.pack_forget()
         self._rebuild_tag_chips(scripts)
 
+        to_create: list[ScriptInfo] = []
         for script_info in scripts:
+            folder_key = script_info.folder_path.name
+            self._script_order.append(folder_key)
+            haystack = f"{script_info.meta.script_name.lower()}\x00{folder_key.lower()}"
+            self._search_index[folder_key] = haystack
+            self._char_masks[folder_key] = _char_mask(haystack)
+            self._tag_sets[folder_key] = frozenset(script_info.meta.tag_list)
+            row = self._rows.get(folder_key)
+            if row is not None:
+                row.update_from(script_info, self._app.process_handler.is_running(folder_key))
+            else:
+                to_create.append(script_info)
+
+        self._build_queue = to_create
+        self._build_rows_batch()
+
+    def _build_rows_batch(self) -> None:
+        """Construct the next slice of new rows, yielding between slices."""
+        self._build_after_id = None
+        batch = self._build_queue[: self.ROW_BUILD_BATCH]
+        del self._build_queue[: self.ROW_BUILD_BATCH]
+
+        if batch and self._icon_set is None:
+            self._icon_set = build_default_iconset()
+
+        for script_info in batch:
             folder_key = script_info.folder_path.name
             row = ScriptRow(
                 self._scroll_frame,
@@ -139,17 +210,21 @@ class InstalledTab(ctk.CTkFrame):
                 on_start=self._app.start_script,
                 on_stop=self._app.stop_script,
                 on_install=self._app.install_requirements,
-                on_open_folder=lambda si: self._app.script_manager.open_folder(si),
+                on_open_folder=self._app.script_manager.open_folder,
                 on_delete=self._app.delete_script,
                 on_schedule=self._app.open_schedule,
                 is_running=self._app.process_handler.is_running(folder_key),
                 on_check_changed=self._on_check_changed,
+                icons=self._icon_set,
             )
-            row.pack(fill="x", padx=5, pady=3)
+            row.pack(**self._ROW_PACK)
             self._rows[folder_key] = row
-            self._script_order.append(folder_key)
 
-        self._apply_filters()
+        # The filter pass re-anchors every visible row in _script_order,
+        # which also puts reused and newly created rows in their places.
+        self._apply_filters_now()
+        if self._build_queue:
+            self._build_after_id = self.after(10, self._build_rows_batch)
 
     def update_script_state(self, folder_key: str, running: bool) -> None:
         if folder_key in self._rows:
@@ -158,63 +233,96 @@ class InstalledTab(ctk.CTkFrame):
     # ── Tag chips ──
 
     def _rebuild_tag_chips(self, scripts: list[ScriptInfo]) -> None:
-        for w in self._tags_frame.winfo_children():
-            w.destroy()
-        self._tag_buttons.clear()
-
         all_tags: set[str] = set()
         for s in scripts:
             all_tags.update(s.meta.tag_list)
 
-        if not all_tags:
+        # The chip row only depends on the tag set — skip the widget
+        # churn (and the sort) when it hasn't changed.
+        tag_set = frozenset(all_tags)
+        if tag_set == self._last_tag_set:
             return
+        self._last_tag_set = tag_set
 
-        # "All" chip
-        all_btn = ctk.CTkButton(
-            self._tags_frame, text="All",
-            font=(FONT_FAMILY, FONT_SIZE_SMALL),
-            fg_color=DEEP_PINK if self._active_tag is None else BG_SURFACE,
-            hover_color=BG_HOVER, text_color=TEXT_PRIMARY,
-            corner_radius=12, width=50, height=26,
-            command=lambda: self._filter_by_tag(None),
-        )
-        all_btn.pack(side="left", padx=2, pady=3)
-        self._tag_buttons[None] = all_btn
+        # Detach the chip row while rebuilding so the per-chip packs
+        # land in one geometry pass when the frame re-attaches.
+        self._tags_frame.pack_forget()
+        for w in self._tags_frame.winfo_children():
+            w.destroy()
+        self._tag_buttons.clear()
 
-        for tag in sorted(all_tags):
-            btn = ctk.CTkButton(
-                self._tags_frame, text=tag,
+        if all_tags:
+            # "All" chip
+            self._tag_buttons[None] = ctk.CTkButton(
+                self._tags_frame, text="All",
                 font=(FONT_FAMILY, FONT_SIZE_SMALL),
-                fg_color=DEEP_PINK if self._active_tag == tag else BG_SURFACE,
+                fg_color=DEEP_PINK if self._active_tag is None else BG_SURFACE,
                 hover_color=BG_HOVER, text_color=TEXT_PRIMARY,
-                corner_radius=12, width=60, height=26,
-                command=lambda t=tag: self._filter_by_tag(t),
+                corner_radius=12, width=50, height=26,
+                command=partial(self._filter_by_tag, None),
             )
-            btn.pack(side="left", padx=2, pady=3)
-            self._tag_buttons[tag] = btn
+            for tag in sorted(all_tags):
+                self._tag_buttons[tag] = ctk.CTkButton(
+                    self._tags_frame, text=tag,
+                    font=(FONT_FAMILY, FONT_SIZE_SMALL),
+                    fg_color=DEEP_PINK if self._active_tag == tag else BG_SURFACE,
+                    hover_color=BG_HOVER, text_color=TEXT_PRIMARY,
+                    corner_radius=12, width=60, height=26,
+                    command=partial(self._filter_by_tag, tag),
+                )
+            for btn in self._tag_buttons.values():
+                btn.pack(side="left", padx=2, pady=3)
+
+        self._tags_frame.pack(fill="x", padx=10, pady=(0, 3), before=self._scroll_frame)
 
     def _filter_by_tag(self, tag: str | None) -> None:
         self._active_tag = tag
         # Update chip colors
         for t, btn in self._tag_buttons.items():
             btn.configure(fg_color=DEEP_PINK if t == tag else BG_SURFACE)
-        self._apply_filters()
+        self._schedule_filter()
 
     # ── Filtering ──
 
-    def _apply_filters(self, event=None) -> None:
+    def _schedule_filter(self, event=None) -> None:
+        """Trailing-edge debounce: one filter pass per typing burst."""
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.after(120, self._apply_filters_now)
+
+    def _apply_filters_now(self) -> None:
         """Apply both search and tag filters, preserving order."""
+        self._filter_after_id = None
         query = self._search_entry.get().lower().strip()
+        q_mask = _char_mask(query) if query else 0
+        active = self._active_tag
+
+        to_show: list[ScriptRow] = []
+        to_hide: list[ScriptRow] = []
         for key in self._script_order:
             row = self._rows.get(key)
             if row is None:
                 continue
-            name_match = not query or query in row.script_info.meta.script_name.lower() or query in key.lower()
-            tag_match = self._active_tag is None or self._active_tag in row.script_info.meta.tag_list
-            if name_match and tag_match:
-                row.pack(fill="x", padx=5, pady=3)
+            name_match = not query or (
+                (self._char_masks[key] & q_mask) == q_mask
+                and query in self._search_index[key]
+            )
+            tag_match = active is None or active in self._tag_sets[key]
+            (to_show if name_match and tag_match else to_hide).append(row)
+
+        # Hide everything first, then pack shows anchored after the
+        # previous visible row — keeps list order stable even for rows
+        # that re-appear, and reflows once at the end instead of per row.
+        for row in to_hide:
+            row.pack_forget()
+        previous: ScriptRow | None = None
+        for row in to_show:
+            if previous is None:
+                row.pack(**self._ROW_PACK)
             else:
-                row.pack_forget()
+                row.pack(after=previous, **self._ROW_PACK)
+            previous = row
+        self.update_idletasks()
 
     # ── Bulk actions ──
 
@@ -222,13 +330,25 @@ class InstalledTab(ctk.CTkFrame):
         checked = self._select_all_var.get()
         for row in self._rows.values():
             row.set_checked(checked)
-
-    def _on_check_changed(self) -> None:
-        all_checked = all(row.is_checked for row in self._rows.values()) if self._rows else False
-        self._select_all_var.set(all_checked)
+        self._checked_keys = set(self._rows) if checked else set()
+
+    def _on_check_changed(self, folder_key: str, checked: bool) -> None:
+        if checked:
+            self._checked_keys.add(folder_key)
+        else:
+            self._checked_keys.discard(folder_key)
+        self._select_all_var.set(
+            bool(self._rows) and len(self._checked_keys) == len(self._rows)
+        )
 
     def _get_checked_scripts(self) -> list[ScriptInfo]:
-        return [row.script_info for row in self._rows.values() if row.is_checked]
+        # The maintained checked set replaces the per-row predicate
+        # scan; iteration order follows the displayed list.
+        return [
+            self._rows[key].script_info
+            for key in self._script_order
+            if key in self._checked_keys and key in self._rows
+        ]
 
     def _on_start_all(self) -> None:
         for si in self._get_checked_scripts():
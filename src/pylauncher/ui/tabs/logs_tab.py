@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from datetime import datetime
 from pathlib import Path
-from tkinter import filedialog
 
 import customtkinter as ctk
 
@@ -57,14 +56,30 @@ class LogsTab(ctk.CTkFrame):
         self._textbox = OutputTextbox(self, border_width=0)
         self._textbox.pack(fill="both", expand=True, padx=5, pady=5)
 
+        # Log calls buffer briefly and flush as one batched insert
+        self._pending: list[str] = []
+        self._flush_scheduled = False
+
     def log(self, message: str) -> None:
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self._textbox.append_line(f"[{timestamp}] {message}")
+        self._pending.append(f"[{timestamp}] {message}")
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after(25, self._flush_pending)
+
+    def _flush_pending(self) -> None:
+        self._flush_scheduled = False
+        lines, self._pending = self._pending, []
+        if lines:
+            self._textbox.append_lines(lines)
 
     def clear(self) -> None:
+        self._pending.clear()
         self._textbox.clear()
 
     def _export_logs(self) -> None:
+        from tkinter import filedialog
+
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         path = filedialog.asksaveasfilename(
             defaultextension=".txt",
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from tkinter import filedialog
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
 import customtkinter as ctk
 
@@ -35,6 +35,11 @@ class RunningTab(ctk.CTkFrame):
         super().__init__(master, fg_color=BG_CARD)
         self._app = app
         self._tab_map: dict[str, tuple[str, OutputTextbox]] = {}
+        self._tab_names: set[str] = set()  # O(1) collision checks
+        # Single-line appends buffer here and flush as one batched
+        # insert per tab on a short timer.
+        self._pending: dict[str, list[str]] = defaultdict(list)
+        self._flush_scheduled = False
 
         self._empty_label = ctk.CTkLabel(
             self, text="No scripts running.",
@@ -61,8 +66,9 @@ class RunningTab(ctk.CTkFrame):
     def add_process_tab(self, folder_key: str, script_name: str) -> None:
         tabview = self._ensure_tabview()
         tab_name = script_name
-        if tab_name in [name for name, _ in self._tab_map.values()]:
+        if tab_name in self._tab_names:
             tab_name = f"{script_name} ({folder_key})"
+        self._tab_names.add(tab_name)
 
         tab_frame = tabview.add(tab_name)
 
@@ -96,9 +102,23 @@ class RunningTab(ctk.CTkFrame):
         self._tab_map[folder_key] = (tab_name, textbox)
 
     def append_output(self, folder_key: str, line: str) -> None:
+        """Buffer one line; flushed as a batch on a 25 ms timer."""
+        self._pending[folder_key].append(line)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after(25, self._flush_pending)
+
+    def _flush_pending(self) -> None:
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, defaultdict(list)
+        for folder_key, lines in pending.items():
+            self.append_output_batch(folder_key, lines)
+
+    def append_output_batch(self, folder_key: str, lines: Iterable[str]) -> None:
+        """Append a batch of output lines with a single widget insert."""
         if folder_key in self._tab_map:
             _, textbox = self._tab_map[folder_key]
-            textbox.append_line(line)
+            textbox.append_lines(lines)
 
     def mark_exited(self, folder_key: str, return_code: int) -> None:
         """Mark a script tab as exited without removing it."""
@@ -111,6 +131,7 @@ class RunningTab(ctk.CTkFrame):
         if folder_key not in self._tab_map:
             return
         tab_name, _ = self._tab_map.pop(folder_key)
+        self._tab_names.discard(tab_name)
         if self._tabview is not None:
             try:
                 self._tabview.delete(tab_name)
@@ -122,6 +143,8 @@ class RunningTab(ctk.CTkFrame):
             self._empty_label.pack(pady=100)
 
     def _export_output(self, textbox: OutputTextbox, script_name: str) -> None:
+        from tkinter import filedialog
+
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         path = filedialog.asksaveasfilename(
             defaultextension=".txt",
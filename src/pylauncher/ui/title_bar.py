@@ -35,6 +35,10 @@ class TitleBar(ctk.CTkFrame):
         self._app_root = master
         self._offset_x = 0
         self._offset_y = 0
+        # Latest drag target; flushed once per idle tick so high-rate
+        # mice don't trigger a WM round-trip per motion event.
+        self._pending_geom: tuple[int, int] | None = None
+        self._geom_scheduled = False
 
         # Title label
         self._title = ctk.CTkLabel(
@@ -97,10 +101,20 @@ class TitleBar(ctk.CTkFrame):
         self._title.bind("<B1-Motion>", self._do_drag)
 
     def _start_drag(self, event) -> None:
-        self._offset_x = event.x
-        self._offset_y = event.y
+        # Pointer offset from the window origin, using the coordinates
+        # Tk already delivers with the event — no per-move pointer query.
+        self._offset_x = event.x_root - self._app_root.winfo_rootx()
+        self._offset_y = event.y_root - self._app_root.winfo_rooty()
 
     def _do_drag(self, event) -> None:
-        x = self._app_root.winfo_pointerx() - self._offset_x
-        y = self._app_root.winfo_pointery() - self._offset_y
-        self._app_root.geometry(f"+{x}+{y}")
+        self._pending_geom = (event.x_root - self._offset_x, event.y_root - self._offset_y)
+        if not self._geom_scheduled:
+            self._geom_scheduled = True
+            self._app_root.after_idle(self._flush_geom)
+
+    def _flush_geom(self) -> None:
+        self._geom_scheduled = False
+        if self._pending_geom is not None:
+            x, y = self._pending_geom
+            self._pending_geom = None
+            self._app_root.geometry(f"+{x}+{y}")
@@ -0,0 +1,143 @@
+"""Canvas-drawn strip of icon actions for list rows."""
+
+from __future__ import annotations
+
+import tkinter as tk
+from typing import Callable
+
+import customtkinter as ctk
+
+from pylauncher.constants import BG_INPUT, ICON_BUTTON_SIZE
+
+# Low-alpha PhotoImage variants for disabled slots, shared per icon —
+# the underlying CTkImages are process-wide, so each dim variant is
+# rendered once.
+_DIM_CACHE: dict[tuple[int, float], object] = {}
+
+
+def _dimmed_photo(image: ctk.CTkImage, scaling: float):
+    key = (id(image), scaling)
+    photo = _DIM_CACHE.get(key)
+    if photo is None:
+        from PIL import ImageTk
+
+        pil = image.cget("light_image").convert("RGBA")
+        width, height = image.cget("size")
+        pil = pil.resize((int(width * scaling), int(height * scaling)))
+        pil.putalpha(pil.getchannel("A").point(lambda a: a // 3))
+        photo = ImageTk.PhotoImage(pil)
+        _DIM_CACHE[key] = photo
+    return photo
+
+
+class ActionStripCanvas(tk.Canvas):
+    """One canvas that draws several clickable icons with hover swap.
+
+    Replaces a row of per-icon button widgets: a single Tk widget with one
+    image item per action instead of a composite canvas-backed widget
+    tree per button — the dominant per-row construction cost in
+    CustomTkinter.
+    """
+
+    SLOT_WIDTH = ICON_BUTTON_SIZE + 10  # icon plus the old per-button padx
+
+    def __init__(
+        self,
+        master: ctk.CTkBaseClass,
+        actions: list[tuple[ctk.CTkImage, ctk.CTkImage, Callable[[], None]]],
+        **kwargs,
+    ) -> None:
+        width = self.SLOT_WIDTH * len(actions)
+        super().__init__(
+            master,
+            width=width,
+            height=ICON_BUTTON_SIZE,
+            bg=BG_INPUT,
+            highlightthickness=0,
+            bd=0,
+            **kwargs,
+        )
+        self._actions = actions
+        # PhotoImages rendered once per (slot, hover) pair; the canvas
+        # holds the references so Tk doesn't garbage-collect them.
+        self._photos: list[tuple[object, object]] = []
+        self._items: list[int] = []
+        self._hover_index: int | None = None
+        self._enabled: list[bool] = [True] * len(actions)
+
+        scaling = 1.0
+        try:
+            scaling = ctk.ScalingTracker.get_widget_scaling(self)
+        except Exception:
+            pass
+        self._scaling = scaling
+
+        for index, (default_img, hover_img, _callback) in enumerate(actions):
+            default_photo = default_img.create_scaled_photo_image(scaling, "dark")
+            hover_photo = hover_img.create_scaled_photo_image(scaling, "dark")
+            self._photos.append((default_photo, hover_photo))
+            x = index * self.SLOT_WIDTH + self.SLOT_WIDTH // 2
+            item = self.create_image(x, ICON_BUTTON_SIZE // 2, image=default_photo)
+            self._items.append(item)
+
+        self.bind("<Motion>", self._on_motion)
+        self.bind("<Leave>", self._on_leave)
+        self.bind("<Button-1>", self._on_click)
+
+    def set_slot_images(self, index: int, default_img: ctk.CTkImage, hover_img: ctk.CTkImage) -> None:
+        """Swap one slot's icon pair (e.g. start ↔ stop)."""
+        callback = self._actions[index][2]
+        self._actions[index] = (default_img, hover_img, callback)
+        default_photo = default_img.create_scaled_photo_image(self._scaling, "dark")
+        hover_photo = hover_img.create_scaled_photo_image(self._scaling, "dark")
+        self._photos[index] = (default_photo, hover_photo)
+        if not self._enabled[index]:
+            shown = _dimmed_photo(default_img, self._scaling)
+        elif self._hover_index == index:
+            shown = hover_photo
+        else:
+            shown = default_photo
+        self.itemconfigure(self._items[index], image=shown)
+
+    def set_slot_enabled(self, index: int, enabled: bool) -> None:
+        """Dim a slot and ignore its hover/clicks while disabled."""
+        if self._enabled[index] == enabled:
+            return
+        self._enabled[index] = enabled
+        if enabled:
+            shown = self._photos[index][1 if self._hover_index == index else 0]
+        else:
+            shown = _dimmed_photo(self._actions[index][0], self._scaling)
+        self.itemconfigure(self._items[index], image=shown)
+
+    def _slot_at(self, x: int) -> int | None:
+        index = x // self.SLOT_WIDTH
+        if 0 <= index < len(self._actions):
+            return index
+        return None
+
+    def _on_motion(self, event) -> None:
+        index = self._slot_at(event.x)
+        if index is not None and not self._enabled[index]:
+            index = None  # disabled slots give no hover feedback
+        if index == self._hover_index:
+            return
+        if self._hover_index is not None:
+            self.itemconfigure(
+                self._items[self._hover_index], image=self._photos[self._hover_index][0]
+            )
+        self._hover_index = index
+        if index is not None:
+            self.itemconfigure(self._items[index], image=self._photos[index][1])
+
+    def _on_leave(self, event=None) -> None:
+        if self._hover_index is not None:
+            self.itemconfigure(
+                self._items[self._hover_index], image=self._photos[self._hover_index][0]
+            )
+            self._hover_index = None
+
+    def _on_click(self, event) -> None:
+        index = self._slot_at(event.x)
+        if index is not None and self._enabled[index]:
+            self._actions[index][2]()
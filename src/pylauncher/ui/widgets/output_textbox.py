@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
+from typing import Iterable
+
 import customtkinter as ctk
 
 from pylauncher.constants import (
@@ -32,8 +35,22 @@ class OutputTextbox(ctk.CTkTextbox):
     """
 
     MAX_LINES = 5000
+    TRIM_EVERY = 256  # amortize the O(lines) Tk delete across appends
 
-    def __init__(self, master: ctk.CTkBaseClass, **kwargs) -> None:
+    def __init__(
+        self, master: ctk.CTkBaseClass, max_lines: int | None = None, **kwargs
+    ) -> None:
+        # Per-instance cap; heavy producers (CLI dialog) pass a lower
+        # limit to keep the widget's working set small.
+        self._max_lines = max_lines if max_lines is not None else self.MAX_LINES
+        self._lines_since_trim = 0
+        # Line count tracked in Python — a fresh Text holds one empty
+        # line; appends advance it without an index() round-trip.
+        self._line_count = 1
+        # Last full-buffer snapshot; None means dirty. Exports and the
+        # search scan both pull the whole buffer, so mutations just drop
+        # the cache instead of each reader re-copying it out of Tcl.
+        self._text_cache: str | None = None
         defaults = {
             "font": (FONT_MONO, FONT_MONO_SIZE),
             "state": "disabled",
@@ -53,6 +70,7 @@ class OutputTextbox(ctk.CTkTextbox):
         self._match_label: ctk.CTkLabel | None = None
         self._search_matches: list[str] = []
         self._current_match_idx: int = -1
+        self._last_query: str = ""
 
         # Configure highlight tags on the underlying Text widget
         self._textbox.tag_config("search_hl", background=HIGHLIGHT_COLOR, foreground="black")
@@ -63,35 +81,75 @@ class OutputTextbox(ctk.CTkTextbox):
         self._textbox.bind("<Control-f>", self._toggle_search)
 
     def append_line(self, text: str) -> None:
+        self.append_lines((text,))
+
+    def append_lines(self, lines: Iterable[str]) -> None:
+        """Append many lines with a single insert/trim/scroll pass."""
+        text = "\n".join(lines)
+        self._text_cache = None
+        search_active = (
+            bool(self._last_query)
+            and self._search_frame is not None
+            and self._search_frame.winfo_ismapped()
+        )
+        first_new_line = self._line_count
+
         self.configure(state="normal")
         self.insert("end", text + "\n")
-        line_count = int(self.index("end-1c").split(".")[0])
-        if line_count > self.MAX_LINES:
-            self.delete("1.0", f"{line_count - self.MAX_LINES}.0")
+        # Trim only every TRIM_EVERY lines — the buffer may overshoot
+        # the cap by that much, but each append costs an int increment
+        # instead of an index query plus a possible O(lines) delete.
+        inserted = text.count("\n") + 1
+        self._lines_since_trim += inserted
+        self._line_count += inserted
+        trimmed = False
+        if self._lines_since_trim >= self.TRIM_EVERY:
+            self._lines_since_trim = 0
+            if self._line_count > self._max_lines:
+                self.delete("1.0", f"{self._line_count - self._max_lines}.0")
+                self._line_count = self._max_lines + 1
+                trimmed = True
         self.configure(state="disabled")
         self.see("end")
 
+        if search_active:
+            if trimmed:
+                self._rescan_search()  # trim shifted every match position
+            else:
+                self._extend_search(first_new_line)
+
     def clear(self) -> None:
         self.configure(state="normal")
         self.delete("1.0", "end")
         self.configure(state="disabled")
+        self._lines_since_trim = 0
+        self._line_count = 1
+        self._text_cache = None
 
     def get_text(self) -> str:
-        """Return all text content."""
-        return self._textbox.get("1.0", "end-1c")
+        """Return all text content (cached until the next mutation)."""
+        if self._text_cache is None:
+            self._text_cache = self._textbox.get("1.0", "end-1c")
+        return self._text_cache
 
     # ── Search overlay ──
 
     def _toggle_search(self, event=None) -> None:
-        if self._search_frame and self._search_frame.winfo_viewable():
+        if self._search_frame is not None and self._search_frame.winfo_ismapped():
             self._close_search()
         else:
-            self._open_search()
+            self._show_search()
         return "break"
 
-    def _open_search(self) -> None:
-        self._search_frame = ctk.CTkFrame(self, fg_color=BG_SURFACE, corner_radius=5)
+    def _show_search(self) -> None:
+        if self._search_frame is None:
+            self._build_search_overlay()
         self._search_frame.place(relx=1.0, y=5, anchor="ne", x=-10)
+        self._search_entry.focus_set()
+
+    def _build_search_overlay(self) -> None:
+        """Construct the overlay once; later toggles just place/forget it."""
+        self._search_frame = ctk.CTkFrame(self, fg_color=BG_SURFACE, corner_radius=5)
 
         self._search_entry = ctk.CTkEntry(
             self._search_frame,
@@ -135,46 +193,143 @@ class OutputTextbox(ctk.CTkTextbox):
         )
         close_btn.pack(side="left", padx=(1, 5), pady=4)
 
-        self._search_entry.focus_set()
-
     def _close_search(self) -> None:
         self._textbox.tag_remove("search_hl", "1.0", "end")
         self._textbox.tag_remove("search_cur", "1.0", "end")
         self._search_matches.clear()
         self._current_match_idx = -1
-        if self._search_frame:
-            self._search_frame.destroy()
-            self._search_frame = None
+        self._last_query = ""
+        if self._search_frame is not None:
+            self._search_entry.delete(0, "end")
+            if self._match_label is not None:
+                self._match_label.configure(text="0/0")
+            self._search_frame.place_forget()
 
     def _do_search(self, event=None) -> None:
         self._textbox.tag_remove("search_hl", "1.0", "end")
         self._textbox.tag_remove("search_cur", "1.0", "end")
-        self._search_matches.clear()
         self._current_match_idx = -1
 
-        query = self._search_entry.get() if self._search_entry else ""
+        query = (self._search_entry.get() if self._search_entry else "").lower()
         if not query:
+            self._search_matches.clear()
+            self._last_query = ""
             if self._match_label:
                 self._match_label.configure(text="0/0")
             return
 
-        start = "1.0"
-        while True:
-            pos = self._textbox.search(query, start, stopindex="end", nocase=True)
-            if not pos:
-                break
-            end = f"{pos}+{len(query)}c"
-            self._textbox.tag_add("search_hl", pos, end)
-            self._search_matches.append(pos)
-            start = end
+        if self._last_query and query.startswith(self._last_query):
+            # Extending the previous query: every new match starts at an
+            # old match position, so narrow the survivors instead of
+            # rescanning the whole buffer.
+            length = f"+{len(query)}c"
+            self._search_matches = [
+                pos
+                for pos in self._search_matches
+                if self._textbox.get(pos, pos + length).lower() == query
+            ]
+        else:
+            self._search_matches = self._scan_matches(query)
+        self._last_query = query
 
         total = len(self._search_matches)
         if total > 0:
+            # Tk accepts interleaved ranges: one tag_add for all matches
+            ranges: list[str] = []
+            for pos in self._search_matches:
+                ranges.append(pos)
+                ranges.append(f"{pos}+{len(query)}c")
+            self._textbox.tag_add("search_hl", *ranges)
             self._current_match_idx = 0
             self._highlight_current()
         if self._match_label:
             self._match_label.configure(text=f"0/{total}" if total == 0 else f"1/{total}")
 
+    def _extend_search(self, from_line: int) -> None:
+        """Tag matches in the newly appended tail only."""
+        query = self._last_query
+        new_matches: list[str] = []
+        start = f"{from_line}.0"
+        while True:
+            pos = self._textbox.search(query, start, stopindex="end", nocase=True)
+            if not pos:
+                break
+            new_matches.append(pos)
+            start = f"{pos}+{len(query)}c"
+        if not new_matches:
+            return
+        ranges: list[str] = []
+        for pos in new_matches:
+            ranges.append(pos)
+            ranges.append(f"{pos}+{len(query)}c")
+        self._textbox.tag_add("search_hl", *ranges)
+        self._search_matches.extend(new_matches)
+        if self._match_label:
+            self._match_label.configure(
+                text=f"{self._current_match_idx + 1}/{len(self._search_matches)}"
+            )
+
+    def _rescan_search(self) -> None:
+        """Full re-search after a trim invalidated match positions."""
+        self._textbox.tag_remove("search_hl", "1.0", "end")
+        self._textbox.tag_remove("search_cur", "1.0", "end")
+        self._search_matches = self._scan_matches(self._last_query)
+        total = len(self._search_matches)
+        self._current_match_idx = 0 if total else -1
+        if total:
+            query = self._last_query
+            ranges: list[str] = []
+            for pos in self._search_matches:
+                ranges.append(pos)
+                ranges.append(f"{pos}+{len(query)}c")
+            self._textbox.tag_add("search_hl", *ranges)
+        if self._match_label:
+            self._match_label.configure(text=f"1/{total}" if total else "0/0")
+
+    def _scan_matches(self, query: str) -> list[str]:
+        """Full-buffer scan returning every match position.
+
+        Pulls the buffer out of Tcl once and scans it with str.find —
+        one round-trip for the whole scan instead of one Text.search
+        call per match. Offsets map back to line.col indices through a
+        bisected line-start table.
+        """
+        text = self.get_text()
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # Unicode case folding changed the length (e.g. 'İ'), so
+            # offsets into the lowered text wouldn't map back to widget
+            # indices — let Tk do this (rare) scan instead.
+            return self._scan_matches_tk(query)
+        text = lowered
+        line_starts = [0]
+        find_newline = text.find
+        offset = find_newline("\n")
+        while offset != -1:
+            line_starts.append(offset + 1)
+            offset = find_newline("\n", offset + 1)
+
+        matches: list[str] = []
+        step = len(query)
+        offset = text.find(query)
+        while offset != -1:
+            line = bisect_right(line_starts, offset) - 1
+            matches.append(f"{line + 1}.{offset - line_starts[line]}")
+            offset = text.find(query, offset + step)
+        return matches
+
+    def _scan_matches_tk(self, query: str) -> list[str]:
+        """Fallback full scan through Tk's own Text.search."""
+        matches: list[str] = []
+        start = "1.0"
+        while True:
+            pos = self._textbox.search(query, start, stopindex="end", nocase=True)
+            if not pos:
+                break
+            matches.append(pos)
+            start = f"{pos}+{len(query)}c"
+        return matches
+
     def _highlight_current(self) -> None:
         self._textbox.tag_remove("search_cur", "1.0", "end")
         if not self._search_matches or self._current_match_idx < 0:
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import tkinter as tk
 from typing import Callable, Optional
 
 import customtkinter as ctk
 
 from pylauncher.constants import (
     BG_INPUT,
+    BG_SURFACE,
     DEEP_PINK,
     DEEP_PINK_HOVER,
     BORDER_COLOR,
@@ -19,8 +21,37 @@ from pylauncher.constants import (
     SCRIPT_ROW_HEIGHT,
 )
 from pylauncher.core.script_manager import ScriptInfo
-from pylauncher.ui.widgets.icon_button import IconButton
-from pylauncher.utils.assets import load_icon_pair
+from pylauncher.ui.widgets.action_strip import ActionStripCanvas
+from pylauncher.utils.assets import IconSet, build_default_iconset
+
+# Row numbers up to 99 come from this table — no f-string per update
+_ROW_NUM_STRS = tuple(f"#{i:02d}" for i in range(100))
+
+# Pre-rendered rounded row backgrounds keyed by width: one PIL render
+# per width instead of CustomTkinter antialiasing a rounded rectangle
+# on every row's canvas per paint.
+_ROW_BG_CACHE: dict[int, "object"] = {}
+
+
+def _row_background(width: int):
+    photo = _ROW_BG_CACHE.get(width)
+    if photo is None:
+        from PIL import Image, ImageDraw, ImageTk
+
+        img = Image.new("RGB", (width, SCRIPT_ROW_HEIGHT), BG_SURFACE)
+        draw = ImageDraw.Draw(img)
+        draw.rounded_rectangle(
+            [0, 0, width - 1, SCRIPT_ROW_HEIGHT - 1], radius=8, fill=BG_INPUT
+        )
+        photo = ImageTk.PhotoImage(img)
+        _ROW_BG_CACHE[width] = photo
+    return photo
+
+
+def _row_num_str(number: int) -> str:
+    if 0 <= number < 100:
+        return _ROW_NUM_STRS[number]
+    return f"#{number:02d}"
 
 
 class ScriptRow(ctk.CTkFrame):
@@ -28,6 +59,9 @@ class ScriptRow(ctk.CTkFrame):
 
     Layout:
     [☐] [#01] [Script Name] [tags] [schedule] [Start/Stop] [Schedule] [Install] [Folder] [Delete]
+
+    Rows are reused across refreshes via update_from(), so every button
+    acts on the row's current ScriptInfo rather than a captured one.
     """
 
     def __init__(
@@ -41,16 +75,34 @@ class ScriptRow(ctk.CTkFrame):
         on_delete: Callable[[ScriptInfo], None],
         on_schedule: Callable[[ScriptInfo], None],
         is_running: bool = False,
-        on_check_changed: Optional[Callable[[], None]] = None,
+        on_check_changed: Optional[Callable[[str, bool], None]] = None,
+        icons: Optional[IconSet] = None,
         **kwargs,
     ) -> None:
-        super().__init__(master, fg_color=BG_INPUT, corner_radius=8, height=SCRIPT_ROW_HEIGHT, **kwargs)
+        super().__init__(
+            master, fg_color="transparent", corner_radius=0, height=SCRIPT_ROW_HEIGHT, **kwargs
+        )
         self.pack_propagate(False)
 
+        # Static image background instead of per-row rounded-corner
+        # drawing; children paint their own BG_INPUT patches on top.
+        # Created right after super().__init__ so it stacks above the
+        # frame's internal fill canvas but below every other child —
+        # do NOT lower() it, that would drop it behind that canvas.
+        self._bg_width = 0
+        self._bg_label = tk.Label(self, bd=0, highlightthickness=0, bg=BG_SURFACE)
+        self._bg_label.place(x=0, y=0)
+        self.bind("<Configure>", self._on_row_resize, add="+")
+
         self._script_info = script_info
         self._is_running = is_running
         self._on_start = on_start
         self._on_stop = on_stop
+        self._on_install = on_install
+        self._on_open_folder = on_open_folder
+        self._on_delete = on_delete
+        self._on_schedule = on_schedule
+        self._on_check_changed = on_check_changed
 
         # Checkbox for bulk actions
         self._checkbox_var = ctk.BooleanVar(value=False)
@@ -65,27 +117,24 @@ class ScriptRow(ctk.CTkFrame):
             fg_color=DEEP_PINK,
             hover_color=DEEP_PINK_HOVER,
             border_color=BORDER_COLOR,
-            command=on_check_changed,
+            bg_color=BG_INPUT,
+            command=self._on_checkbox_toggle,
         )
-        self._checkbox.pack(side="left", padx=(10, 0))
-
-        # Load icon pairs
-        self._start_icons = load_icon_pair("start")
-        self._stop_icons = load_icon_pair("stop")
-        self._install_icons = load_icon_pair("install")
-        self._folder_icons = load_icon_pair("folder")
-        self._delete_icons = load_icon_pair("delete")
-        self._timer_icons = load_icon_pair("timer")
+        # Checkbox and row number have fixed geometry — place() skips
+        # the packer's constraint solving for them entirely.
+        self._checkbox.place(x=10, rely=0.5, anchor="w")
 
         # Row number
+        self._last_number = script_info.row_number
         self._number_label = ctk.CTkLabel(
             self,
-            text=f"#{script_info.row_number:02d}",
+            text=_row_num_str(script_info.row_number),
             font=(FONT_FAMILY, FONT_SIZE_SMALL),
             text_color=TEXT_SECONDARY,
+            bg_color=BG_INPUT,
             width=35,
         )
-        self._number_label.pack(side="left", padx=(8, 5))
+        self._number_label.place(x=38, rely=0.5, anchor="w")
 
         # Script name
         self._name_label = ctk.CTkLabel(
@@ -93,66 +142,76 @@ class ScriptRow(ctk.CTkFrame):
             text=script_info.meta.script_name,
             font=(FONT_FAMILY, FONT_SIZE_DEFAULT),
             text_color=TEXT_PRIMARY,
+            bg_color=BG_INPUT,
             anchor="w",
         )
-        self._name_label.pack(side="left", fill="x", expand=True, padx=5)
-
-        # Tags display
-        tags = script_info.meta.tag_list
-        if tags:
-            tags_text = " ".join(f"[{t}]" for t in tags[:3])
-            self._tags_label = ctk.CTkLabel(
-                self,
-                text=tags_text,
-                font=(FONT_FAMILY, 10),
-                text_color=TEXT_SECONDARY,
-            )
-            self._tags_label.pack(side="left", padx=5)
-
-        # Schedule indicator
-        if script_info.meta.has_schedule:
-            self._schedule_label = ctk.CTkLabel(
-                self,
-                text=script_info.meta.schedule_display,
-                font=(FONT_FAMILY, 10),
-                text_color=DEEP_PINK,
-            )
-            self._schedule_label.pack(side="left", padx=5)
-
-        # Action buttons (right to left)
-        self._delete_btn = IconButton(
-            self, self._delete_icons[0], self._delete_icons[1],
-            command=lambda: on_delete(script_info),
-        )
-        self._delete_btn.pack(side="right", padx=5)
+        # The left pad clears the placed checkbox/number zone; name,
+        # tags, and schedule keep flow layout since their widths vary.
+        self._name_label.pack(side="left", fill="x", expand=True, padx=(83, 5))
 
-        self._folder_btn = IconButton(
-            self, self._folder_icons[0], self._folder_icons[1],
-            command=lambda: on_open_folder(script_info),
+        # Tags / schedule labels are permanent; presence is toggled via
+        # pack/pack_forget so recycling a row never destroys widgets.
+        self._tags_label = ctk.CTkLabel(
+            self, text="", font=(FONT_FAMILY, 10), text_color=TEXT_SECONDARY,
+            bg_color=BG_INPUT,
         )
-        self._folder_btn.pack(side="right", padx=5)
-
-        self._install_btn = IconButton(
-            self, self._install_icons[0], self._install_icons[1],
-            command=lambda: on_install(script_info),
+        self._schedule_label = ctk.CTkLabel(
+            self, text="", font=(FONT_FAMILY, 10), text_color=DEEP_PINK,
+            bg_color=BG_INPUT,
         )
-        self._install_btn.pack(side="right", padx=5)
-        if not script_info.has_requirements:
-            self._install_btn.configure(state="disabled")
+        self._tags_visible = False
+        self._schedule_visible = False
+        self._set_tags_text(script_info)
+        self._set_schedule_text(script_info)
 
-        self._schedule_btn = IconButton(
-            self, self._timer_icons[0], self._timer_icons[1],
-            command=lambda: on_schedule(script_info),
-        )
-        self._schedule_btn.pack(side="right", padx=5)
+        # Action buttons (and their icon images) mount just-in-time the
+        # first time the row is shown, keeping bulk row construction to
+        # the cheap label widgets.
+        self._actions_mounted = False
+        self._install_enabled = script_info.has_requirements
+        self._icons = icons  # resolved at mount when not injected
+        self.bind("<Map>", self._on_first_map)
 
-        self._start_stop_btn = IconButton(
-            self,
-            self._start_icons[0] if not is_running else self._stop_icons[0],
-            self._start_icons[1] if not is_running else self._stop_icons[1],
-            command=self._on_start_stop_click,
-        )
-        self._start_stop_btn.pack(side="right", padx=5)
+    def _on_row_resize(self, event) -> None:
+        if event.width > 1 and event.width != self._bg_width:
+            self._bg_width = event.width
+            self._bg_label.configure(image=_row_background(event.width))
+
+    def _on_first_map(self, event=None) -> None:
+        self.unbind("<Map>")
+        self.mount_actions()
+
+    _RUN_SLOT = 0  # start/stop position in the action strip
+    _INSTALL_SLOT = 2  # install position — dimmed without requirements.txt
+
+    def mount_actions(self) -> None:
+        """Build the canvas action strip on first show.
+
+        One canvas with an image item per action replaces five
+        per-icon button widget trees per row.
+        """
+        if self._actions_mounted:
+            return
+        self._actions_mounted = True
+
+        if self._icons is None:
+            self._icons = build_default_iconset()
+        icons = self._icons
+        run_icons = icons.stop if self._is_running else icons.start
+
+        actions = [
+            (*run_icons, self._on_start_stop_click),
+            (*icons.timer, self._on_schedule_click),
+            (*icons.install, self._on_install_click),
+            (*icons.folder, self._on_folder_click),
+            (*icons.delete, self._on_delete_click),
+        ]
+        self._action_strip = ActionStripCanvas(self, actions)
+        self._action_strip.pack(side="right", padx=5)
+        if not self._install_enabled:
+            self._action_strip.set_slot_enabled(self._INSTALL_SLOT, False)
+
+    # ── Click handlers (always act on the current ScriptInfo) ──
 
     def _on_start_stop_click(self) -> None:
         if self._is_running:
@@ -160,15 +219,75 @@ class ScriptRow(ctk.CTkFrame):
         else:
             self._on_start(self._script_info)
 
+    def _on_install_click(self) -> None:
+        if self._install_enabled:
+            self._on_install(self._script_info)
+
+    def _on_folder_click(self) -> None:
+        self._on_open_folder(self._script_info)
+
+    def _on_delete_click(self) -> None:
+        self._on_delete(self._script_info)
+
+    def _on_schedule_click(self) -> None:
+        self._on_schedule(self._script_info)
+
+    def _on_checkbox_toggle(self) -> None:
+        """User click: report (folder_key, checked) for incremental tracking."""
+        if self._on_check_changed is not None:
+            self._on_check_changed(self.folder_key, self._checkbox_var.get())
+
+    # ── State updates ──
+
+    def update_from(self, script_info: ScriptInfo, is_running: bool) -> None:
+        """Reconfigure this row in place for a refreshed ScriptInfo."""
+        self._script_info = script_info
+        self.update_row_number(script_info.row_number)
+        self._name_label.configure(text=script_info.meta.script_name)
+        self._set_tags_text(script_info)
+        self._set_schedule_text(script_info)
+        self._install_enabled = script_info.has_requirements
+        if self._actions_mounted:
+            self._action_strip.set_slot_enabled(self._INSTALL_SLOT, self._install_enabled)
+        self.set_running(is_running)
+        self.set_checked(False)
+
+    def _set_tags_text(self, script_info: ScriptInfo) -> None:
+        tags_text = script_info.meta.tags_display
+        if tags_text:
+            self._tags_label.configure(text=tags_text)
+            if not self._tags_visible:
+                self._tags_visible = True
+                self._tags_label.pack(side="left", padx=5, after=self._name_label)
+        elif self._tags_visible:
+            self._tags_visible = False
+            self._tags_label.pack_forget()
+
+    def _set_schedule_text(self, script_info: ScriptInfo) -> None:
+        if script_info.meta.has_schedule:
+            self._schedule_label.configure(text=script_info.meta.schedule_display)
+            if not self._schedule_visible:
+                self._schedule_visible = True
+                anchor = self._tags_label if self._tags_visible else self._name_label
+                self._schedule_label.pack(side="left", padx=5, after=anchor)
+        elif self._schedule_visible:
+            self._schedule_visible = False
+            self._schedule_label.pack_forget()
+
     def set_running(self, running: bool) -> None:
+        if running == self._is_running:
+            return  # no redraw when the state is already shown
         self._is_running = running
-        if running:
-            self._start_stop_btn.update_icons(self._stop_icons[0], self._stop_icons[1])
-        else:
-            self._start_stop_btn.update_icons(self._start_icons[0], self._start_icons[1])
+        if not self._actions_mounted:
+            return  # mount_actions applies the right icons later
+        pair = self._icons.stop if running else self._icons.start
+        self._action_strip.set_slot_images(self._RUN_SLOT, pair[0], pair[1])
 
     def update_row_number(self, number: int) -> None:
-        self._number_label.configure(text=f"#{number:02d}")
+        if number == self._last_number:
+            return  # unchanged — skip the configure/redraw
+        self._last_number = number
+        self._number_label.configure(text=_row_num_str(number))
 
     @property
     def is_checked(self) -> bool:
@@ -2,16 +2,24 @@
 
 from __future__ import annotations
 
+import os
 import sys
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-
-import customtkinter as ctk
-from PIL import Image
+from typing import TYPE_CHECKING
 
 from pylauncher.constants import ICON_SIZE
 
+if TYPE_CHECKING:
+    import customtkinter as ctk
+
+# PIL and customtkinter are imported inside the icon loaders: the path
+# getters here run early in startup and shouldn't pull image libraries
+# into the import graph.
 
+
+@lru_cache(maxsize=None)
 def get_base_path() -> Path:
     """Get the base path for the application.
 
@@ -19,15 +27,28 @@ def get_base_path() -> Path:
     """
     if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
         return Path(sys._MEIPASS)
-    # Development: go up from src/pylauncher/utils/ to project root
-    return Path(__file__).resolve().parent.parent.parent.parent
+    # Development: go up from src/pylauncher/utils/ to project root.
+    # Plain dirname hops — resolve()'s per-component symlink stats buy
+    # nothing for a path that's immediately joined to known subdirs.
+    here = os.path.abspath(__file__)
+    for _ in range(4):
+        here = os.path.dirname(here)
+    return Path(here)
 
 
+@lru_cache(maxsize=None)
 def get_assets_dir() -> Path:
     """Get the assets directory path."""
     return get_base_path() / "assets"
 
 
+@lru_cache(maxsize=None)
+def _img_dir() -> Path:
+    """The assets/img directory, resolved once."""
+    return get_assets_dir() / "img"
+
+
+@lru_cache(maxsize=None)
 def get_scripts_dir() -> Path:
     """Get the scripts directory path.
 
@@ -38,6 +59,7 @@ def get_scripts_dir() -> Path:
     return get_base_path() / "scripts"
 
 
+@lru_cache(maxsize=None)
 def get_settings_path() -> Path:
     """Get the settings.ini file path."""
     if getattr(sys, "frozen", False):
@@ -45,6 +67,7 @@ def get_settings_path() -> Path:
     return get_base_path() / "settings.ini"
 
 
+@lru_cache(maxsize=None)
 def get_state_path() -> Path:
     """Get the state.json file path for session persistence."""
     if getattr(sys, "frozen", False):
@@ -52,45 +75,88 @@ def get_state_path() -> Path:
     return get_base_path() / "state.json"
 
 
+@lru_cache(maxsize=None)
 def get_app_icon_path() -> Path:
-    """Get (or create) an .ico file for the app window/taskbar icon."""
-    ico_path = get_assets_dir() / "img" / "app_icon.ico"
-    if not ico_path.exists():
-        from PIL import ImageDraw, ImageFont
-
-        size = 256
-        img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-        draw.rounded_rectangle([8, 8, size - 8, size - 8], radius=40, fill="#FF1493")
-        try:
-            font = ImageFont.truetype("arialbd.ttf", 140)
-        except OSError:
-            font = ImageFont.load_default()
-        draw.text((size // 2, size // 2), "P", fill="white", font=font, anchor="mm")
-        ico_path.parent.mkdir(parents=True, exist_ok=True)
-        img.save(ico_path, format="ICO", sizes=[(256, 256), (48, 48), (32, 32), (16, 16)])
-    return ico_path
-
-
-def load_icon(name: str, size: tuple[int, int] = ICON_SIZE) -> ctk.CTkImage:
-    """Load a single icon as a CTkImage."""
-    img_path = get_assets_dir() / "img" / f"{name}.png"
-    img = Image.open(img_path)
-    return ctk.CTkImage(light_image=img, size=size)
+    """Get the bundled .ico for the app window/taskbar icon.
+
+    The icon is pre-rendered and shipped in assets (regenerate with
+    tools/build_icons.py), so first launch pays no PIL draw or ICO
+    encode.
+    """
+    return _img_dir() / "app_icon.ico"
+
 
+@lru_cache(maxsize=None)
+def load_icon(name: str, size: tuple[int, int] = ICON_SIZE) -> "ctk.CTkImage":
+    """Load a single icon as a CTkImage, decoded once per process."""
+    import customtkinter as ctk
+    from PIL import Image
 
+    # The context manager releases the file handle; copy() detaches the
+    # decoded pixels from it so no fd lingers in the cache.
+    with Image.open(_img_dir() / f"{name}.png") as img:
+        img.load()
+        return ctk.CTkImage(light_image=img.copy(), size=size)
+
+
+@lru_cache(maxsize=None)
 def load_icon_pair(
     name: str, size: tuple[int, int] = ICON_SIZE
-) -> tuple[ctk.CTkImage, ctk.CTkImage]:
+) -> "tuple[ctk.CTkImage, ctk.CTkImage]":
     """Load default and hover icon variants as CTkImage objects.
 
-    Returns (default_ctk_image, hover_ctk_image).
+    Returns (default_ctk_image, hover_ctk_image). Cached per
+    (name, size): the icon set is fixed, so one decoded pair backs
+    every row instead of two PNG decodes per button per row.
     """
-    img_dir = get_assets_dir() / "img"
-    default_img = Image.open(img_dir / f"{name}_icon.png")
-    hover_img = Image.open(img_dir / f"{name}_hover_icon.png")
-
-    default_ctk = ctk.CTkImage(light_image=default_img, size=size)
-    hover_ctk = ctk.CTkImage(light_image=hover_img, size=size)
+    import customtkinter as ctk
+    from PIL import Image
+
+    img_dir = _img_dir()
+    # Context managers release the file handles; copy() detaches the
+    # decoded pixels so the cached images hold no fds.
+    with Image.open(img_dir / f"{name}_icon.png") as default_img:
+        default_img.load()
+        default_ctk = ctk.CTkImage(light_image=default_img.copy(), size=size)
+    with Image.open(img_dir / f"{name}_hover_icon.png") as hover_img:
+        hover_img.load()
+        hover_ctk = ctk.CTkImage(light_image=hover_img.copy(), size=size)
+
+    # Prime the PhotoImage variant for the current scaling so the first
+    # paint (and hover swap) doesn't pay the PIL resize. CTkImage
+    # memoizes per scaled size, and these instances are process-shared,
+    # so each (icon, scale) variant is built exactly once.
+    try:
+        scaling = ctk.ScalingTracker.widget_scaling
+        default_ctk.create_scaled_photo_image(scaling, "dark")
+        hover_ctk.create_scaled_photo_image(scaling, "dark")
+    except Exception:
+        pass  # No Tk root yet — variants build lazily on first draw
 
     return default_ctk, hover_ctk
+
+
+@dataclass(frozen=True, slots=True)
+class IconSet:
+    """Every row-action icon pair, loaded together.
+
+    Rows read plain attributes instead of going through the cache per
+    icon; one instance is shared by the whole installed list.
+    """
+
+    start: "tuple[ctk.CTkImage, ctk.CTkImage]"
+    stop: "tuple[ctk.CTkImage, ctk.CTkImage]"
+    timer: "tuple[ctk.CTkImage, ctk.CTkImage]"
+    install: "tuple[ctk.CTkImage, ctk.CTkImage]"
+    folder: "tuple[ctk.CTkImage, ctk.CTkImage]"
+    delete: "tuple[ctk.CTkImage, ctk.CTkImage]"
+
+
+def build_default_iconset() -> IconSet:
+    """Load all action icon pairs in one batch."""
+    return IconSet(
+        **{
+            name: load_icon_pair(name)
+            for name in ("start", "stop", "timer", "install", "folder", "delete")
+        }
+    )
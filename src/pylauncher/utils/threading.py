@@ -2,31 +2,122 @@
 
 from __future__ import annotations
 
+import atexit
+import os
 import threading
+import weakref
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from tkinter import TclError
 from typing import Any, Callable
 
 import customtkinter as ctk
 
+# Two shared pools instead of one FIFO: a wide one for IO-bound work
+# (subprocess waits, filesystem, network) and a narrow one for CPU-bound
+# work (PIL, JSON), so a slow pip install can't head-of-line block a
+# trivial folder open.
+_IO_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="pylauncher-bg-io")
+_CPU_POOL = ThreadPoolExecutor(
+    max_workers=min(4, os.cpu_count() or 2), thread_name_prefix="pylauncher-bg-cpu"
+)
+atexit.register(_IO_POOL.shutdown, wait=False)
+atexit.register(_CPU_POOL.shutdown, wait=False)
+
 
 def run_in_thread(
     target: Callable[..., Any],
     *args: Any,
+    kind: str = "io",
     daemon: bool = True,
     **kwargs: Any,
-) -> threading.Thread:
-    """Start a function in a daemon background thread."""
-    thread = threading.Thread(target=target, args=args, kwargs=kwargs, daemon=daemon)
-    thread.start()
-    return thread
+) -> Future:
+    """Run a function on a shared background pool.
+
+    kind selects the executor ("io" or "cpu"). Returns the Future
+    (supports cancellation and exception propagation, which the old
+    Thread handle did not). The daemon flag is kept for call-site
+    compatibility and ignored — workers are managed by the executors.
+    """
+    pool = _CPU_POOL if kind == "cpu" else _IO_POOL
+    return pool.submit(target, *args, **kwargs)
+
+
+def submit_io(target: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+    """Submit IO-bound work (subprocess, filesystem, network)."""
+    return _IO_POOL.submit(target, *args, **kwargs)
+
+
+def submit_cpu(target: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+    """Submit CPU-bound work (image/JSON processing)."""
+    return _CPU_POOL.submit(target, *args, **kwargs)
+
+
+def cancel_all() -> None:
+    """Shut down both pools, cancelling queued work. Called on app exit."""
+    _IO_POOL.shutdown(wait=False, cancel_futures=True)
+    _CPU_POOL.shutdown(wait=False, cancel_futures=True)
+
+
+# Callbacks pending per widget; the first arrival schedules one drain
+# tick that runs everything queued since — high-rate producers post one
+# Tk event per ~16 ms instead of one per callback. Keys are weak
+# references so a destroyed widget can't anchor its queue (or itself)
+# in memory across a long session.
+_PENDING: "dict[weakref.ref, deque]" = {}
+_PENDING_LOCK = threading.Lock()
+
+
+def _widget_alive(widget: ctk.CTkBaseClass) -> bool:
+    try:
+        return bool(widget.winfo_exists())
+    except (RuntimeError, TclError):
+        return False
 
 
 def schedule_on_main(widget: ctk.CTkBaseClass, callback: Callable[[], None]) -> None:
-    """Schedule a callback on the Tkinter main thread.
+    """Schedule a callback on the Tkinter main thread, coalesced.
 
     Background threads must NEVER directly modify widget state.
-    Use this to safely update UI from a background thread.
+    Use this to safely update UI from a background thread; callbacks
+    queued within the same ~16 ms window run in one Tk turn. Use
+    schedule_on_main_now when single-callback latency matters.
     """
+    if not _widget_alive(widget):
+        return
+    ref = weakref.ref(widget)
+    with _PENDING_LOCK:
+        queue = _PENDING.get(ref)
+        if queue is None:
+            queue = _PENDING[ref] = deque()
+        queue.append(callback)
+        first = len(queue) == 1
+    if first:
+        try:
+            widget.after(16, _drain, ref)
+        except (RuntimeError, TclError):
+            with _PENDING_LOCK:
+                _PENDING.pop(ref, None)  # Widget was destroyed
+
+
+def schedule_on_main_now(widget: ctk.CTkBaseClass, callback: Callable[[], None]) -> None:
+    """Schedule a callback for Tk's idle loop without coalescing."""
     try:
-        widget.after(0, callback)
-    except RuntimeError:
+        if not widget.winfo_exists():
+            return
+        widget.after_idle(callback)
+    except (RuntimeError, TclError):
         pass  # Widget was destroyed
+
+
+def _drain(ref: "weakref.ref") -> None:
+    # Swap the queue out before running callbacks so re-entrant
+    # schedule_on_main calls start a fresh batch, and sweep queues
+    # whose widgets died before their drain ever ran.
+    with _PENDING_LOCK:
+        queue = _PENDING.pop(ref, None)
+        for dead in [r for r in _PENDING if r() is None]:
+            del _PENDING[dead]
+    if queue and ref() is not None:
+        for callback in queue:
+            callback()
@@ -0,0 +1,31 @@
+"""Regenerate the bundled app icon (assets/img/app_icon.ico).
+
+The icon ships with the repo so first launch never pays PIL draw and
+multi-size ICO encode; run this tool only when the design changes.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from PIL import Image, ImageDraw, ImageFont
+
+
+def build_app_icon(ico_path: Path) -> None:
+    size = 256
+    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    draw.rounded_rectangle([8, 8, size - 8, size - 8], radius=40, fill="#FF1493")
+    try:
+        font = ImageFont.truetype("arialbd.ttf", 140)
+    except OSError:
+        font = ImageFont.load_default()
+    draw.text((size // 2, size // 2), "P", fill="white", font=font, anchor="mm")
+    ico_path.parent.mkdir(parents=True, exist_ok=True)
+    img.save(ico_path, format="ICO", sizes=[(256, 256), (48, 48), (32, 32), (16, 16)])
+
+
+if __name__ == "__main__":
+    target = Path(__file__).resolve().parent.parent / "assets" / "img" / "app_icon.ico"
+    build_app_icon(target)
+    print(f"Wrote {target}")